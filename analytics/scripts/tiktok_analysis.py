@@ -1,43 +1,221 @@
 """
 TikTok Finance Bill Analysis & Visualization
-Analyze the processed CSV data to identify key insights
+Analyze the processed Parquet data to identify key insights
 """
 
 import pandas as pd
+import polars as pl
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
-from datetime import datetime
-import ast
-from collections import Counter
+from functools import cached_property
+from dataclasses import dataclass
+
+def _quantile(values, q):
+    """Linear-interpolated quantile (as Series.quantile) via np.partition"""
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return np.nan
+    pos = (len(values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(values) - 1)
+    part = np.partition(values, [lo, hi])
+    return part[lo] + (part[hi] - part[lo]) * (pos - lo)
+
+@dataclass
+class CoreFrames:
+    """Frames shared by the TikTok analyses, plots and research summary"""
+    influencer_stats: pl.DataFrame
+    totals: dict
+    hashtag_df: pd.DataFrame
+    daily_hashtags: pd.DataFrame
+    hashtag_counts: pd.Series
+    daily_activity: pd.DataFrame
+    viral_content: pd.DataFrame
+    viral_thresholds: tuple
 
 class TikTokAnalyzer:
-    def __init__(self, processed_csv_path, finance_bill_csv_path):
+    # Columns the analysis methods actually read from the Finance Bill data
+    _USECOLS = [
+        'video_id', 'author_username', 'author_display_name', 'author_followers',
+        'likes', 'comments', 'shares', 'views', 'created_at', 'hashtags'
+    ]
+    
+    # Narrow engagement counts, categorical author columns
+    _DTYPES = {
+        'likes': pl.Int32, 'comments': pl.Int32, 'shares': pl.Int32,
+        'views': pl.Int64, 'author_followers': pl.Int64,
+        'author_username': pl.Categorical, 'author_display_name': pl.Categorical
+    }
+    
+    # Key dates in the Finance Bill protests
+    KEY_DATES = {
+        '2024-06-18': 'Finance Bill 2024 introduced',
+        '2024-06-20': 'First major protests',
+        '2024-06-25': 'Parliament occupation',
+        '2024-06-26': 'President Ruto response',
+        '2024-07-02': 'Continued protests'
+    }
+    
+    def __init__(self, processed_path, finance_bill_path, streaming_chunk_size=500_000):
         """
-        Initialize analyzer with processed CSV files
+        Initialize analyzer with processed Parquet files
         
         Args:
-            processed_csv_path (str): Path to tiktok_processed.csv
-            finance_bill_csv_path (str): Path to tiktok_finance_bill.csv
+            processed_path (str): Path to tiktok_processed.parquet
+            finance_bill_path (str): Path to tiktok_finance_bill.parquet
+            streaming_chunk_size (int): Rows per chunk in Polars' streaming engine while
+                the Finance Bill data is read (the collected frame is still held in full)
         """
-        self.processed_df = pd.read_csv(processed_csv_path)
-        self.finance_df = pd.read_csv(finance_bill_csv_path)
-        
-        # Convert string representation of lists back to actual lists
-        self.finance_df['hashtags'] = self.finance_df['hashtags'].apply(self._parse_hashtags)
+        # The full processed set is only counted here; see processed_df
+        self.processed_path = processed_path
+        total_videos = pl.scan_parquet(processed_path).select(pl.len()).collect().item()
+        
+        # Read the Finance Bill data with the streaming engine, keeping only the columns we use
+        with pl.Config(streaming_chunk_size=streaming_chunk_size):
+            self.finance_pl = (
+                pl.scan_parquet(finance_bill_path)
+                .select(self._USECOLS)
+                # Empty author fields are missing values, as they were in the CSVs
+                .with_columns(pl.col('author_username', 'author_display_name').replace('', None))
+                .cast(self._DTYPES)
+                # created_at is TikTok's createTime (epoch seconds)
+                .with_columns(pl.from_epoch('created_at', time_unit='s'))
+                .collect(engine='streaming')
+            )
+        self.finance_df = self.finance_pl.to_pandas()
+        
+        # created_at arrives typed from Parquet; derive the day once here
+        self.finance_df['date'] = self.finance_df['created_at'].dt.date
         
-        print(f"✅ Loaded {len(self.processed_df)} total videos")
+        print(f"✅ Loaded {total_videos} total videos")
         print(f"✅ Loaded {len(self.finance_df)} Finance Bill videos")
         
-    def _parse_hashtags(self, hashtag_str):
-        """Parse hashtag string back to list"""
-        try:
-            return ast.literal_eval(hashtag_str)
-        except:
-            return []
+    @cached_property
+    def processed_df(self):
+        """All processed videos, read on first access"""
+        return pd.read_parquet(self.processed_path)
+    
+    @cached_property
+    def core(self):
+        """Shared analysis frames, built once on first access"""
+        return self._build_core_frames()
+    
+    def _build_core_frames(self):
+        """
+        Build every frame the analyses, plots and summary read from
+        
+        Each result is derived once from the loaded Finance Bill data and
+        shared, instead of each analysis re-scanning finance_df.
+        """
+        df = self.finance_df
+        
+        # Creator metrics, sorted by total engagement (Polars group_by)
+        influencer_stats = (
+            self.finance_pl
+            .filter(pl.col('author_username').is_not_null())
+            .group_by('author_username')
+            .agg([
+                pl.col('likes').cast(pl.Int64).sum().alias('likes_sum'),
+                pl.col('likes').mean().alias('likes_mean'),
+                pl.col('comments').cast(pl.Int64).sum().alias('comments_sum'),
+                pl.col('comments').mean().alias('comments_mean'),
+                pl.col('shares').cast(pl.Int64).sum().alias('shares_sum'),
+                pl.col('shares').mean().alias('shares_mean'),
+                pl.col('views').cast(pl.Int64).sum().alias('views_sum'),
+                pl.col('views').mean().alias('views_mean'),
+                pl.col('video_id').count().alias('video_id_count'),
+                pl.col('author_followers').first().alias('author_followers_first'),
+                pl.col('author_display_name').first().alias('author_display_name_first'),
+                pl.col('created_at').first().alias('created_at_first'),
+                pl.col('created_at').last().alias('created_at_last'),
+            ])
+            .with_columns(
+                (pl.col('likes_sum') + pl.col('comments_sum') + pl.col('shares_sum'))
+                .alias('total_engagement')
+            )
+            .sort('total_engagement', descending=True)
+        )
+        
+        # Dataset-wide totals in one Polars select
+        totals = self.finance_pl.select(
+            (pl.col('likes').cast(pl.Int64).sum()
+             + pl.col('comments').cast(pl.Int64).sum()
+             + pl.col('shares').cast(pl.Int64).sum()).alias('total_engagement'),
+            pl.col('created_at').min().alias('start_date'),
+            pl.col('created_at').max().alias('end_date'),
+            pl.col('views').max().alias('top_video_views'),
+            pl.col('author_followers').max().alias('top_creator_followers'),
+        ).row(0, named=True)
+        totals['start_date'] = pd.Timestamp(totals['start_date'])
+        totals['end_date'] = pd.Timestamp(totals['end_date'])
+        
+        # Long-form (hashtag, created_at, likes, views, date) table, one row per
+        # hashtag use; the day is the same datetime.date key daily_activity uses
+        hashtag_df = (
+            df[['hashtags', 'created_at', 'likes', 'views', 'date']]
+            .explode('hashtags')
+            .dropna(subset=['hashtags'])
+            .rename(columns={'hashtags': 'hashtag'})
+            .reset_index(drop=True)
+        )
+        hashtag_counts = hashtag_df['hashtag'].value_counts()
+        
+        # Daily hashtag usage, grouping on categorical codes (authors are
+        # already categorical from the load)
+        hashtag_df['hashtag'] = hashtag_df['hashtag'].astype('category')
+        daily_hashtags = (
+            hashtag_df.groupby(['date', 'hashtag'], observed=True)
+            .size()
+            .reset_index(name='count')
+        )
+        
+        # Daily activity
+        daily_activity = df.groupby('date').agg(
+            video_count=('video_id', 'count'),
+            likes=('likes', 'sum'),
+            views=('views', 'sum'),
+            shares=('shares', 'sum')
+        )
+        
+        # Viral thresholds (top 10%) and the videos above either of them
+        views = df['views'].to_numpy(dtype=np.float64)
+        likes = df['likes'].to_numpy(dtype=np.float64)
+        viral_threshold_views = _quantile(views, 0.9)
+        viral_threshold_likes = _quantile(likes, 0.9)
+        viral_content = df[(views >= viral_threshold_views) | (likes >= viral_threshold_likes)]
+        
+        return CoreFrames(
+            influencer_stats=influencer_stats,
+            totals=totals,
+            hashtag_df=hashtag_df,
+            daily_hashtags=daily_hashtags,
+            hashtag_counts=hashtag_counts,
+            daily_activity=daily_activity,
+            viral_content=viral_content,
+            viral_thresholds=(viral_threshold_views, viral_threshold_likes),
+        )
+    
+    def _top_influencers(self, n):
+        """Top n creators with per-video and rate metrics, as pandas"""
+        return (
+            self.core.influencer_stats
+            .head(n)
+            # Creators with no recorded views get a 0% rate rather than inf
+            .with_columns(
+                (pl.col('total_engagement') / pl.col('video_id_count'))
+                .alias('avg_engagement_per_video'),
+                pl.when(pl.col('views_sum') > 0)
+                .then(pl.col('total_engagement') / pl.col('views_sum') * 100)
+                .otherwise(0.0)
+                .alias('engagement_rate'),
+            )
+            .to_pandas()
+            .set_index('author_username')
+        )
     
     def analyze_top_influencers(self, n=20):
         """
@@ -47,43 +225,16 @@ class TikTokAnalyzer:
         print("\n🎯 TOP GEN-Z FINANCE BILL INFLUENCERS")
         print("="*50)
         
-        # Group by creator and calculate comprehensive metrics
-        influencer_stats = self.finance_df.groupby('author_username').agg({
-            'likes': ['sum', 'mean'],
-            'comments': ['sum', 'mean'],
-            'shares': ['sum', 'mean'],
-            'views': ['sum', 'mean'],
-            'video_id': 'count',
-            'author_followers': 'first',
-            'author_display_name': 'first',
-            'created_at': ['first', 'last']
-        }).round(2)
-        
-        # Flatten column names
-        influencer_stats.columns = ['_'.join(col).strip() for col in influencer_stats.columns]
-        
-        # Calculate engagement metrics
-        influencer_stats['total_engagement'] = (influencer_stats['likes_sum'] + 
-                                              influencer_stats['comments_sum'] + 
-                                              influencer_stats['shares_sum'])
-        
-        influencer_stats['avg_engagement_per_video'] = (influencer_stats['total_engagement'] / 
-                                                       influencer_stats['video_id_count'])
-        
-        influencer_stats['engagement_rate'] = (influencer_stats['total_engagement'] / 
-                                             influencer_stats['views_sum'] * 100)
-        
-        # Sort by total engagement
-        top_influencers = influencer_stats.sort_values('total_engagement', ascending=False).head(n)
+        top_influencers = self._top_influencers(n)
         
         print(f"📊 Top {n} Finance Bill TikTok Influencers:")
-        for i, (username, stats) in enumerate(top_influencers.iterrows(), 1):
-            print(f"{i:2d}. @{username}")
-            print(f"    📹 Videos: {stats['video_id_count']}")
-            print(f"    👥 Followers: {stats['author_followers_first']:,}")
-            print(f"    💖 Total Engagement: {stats['total_engagement']:,.0f}")
-            print(f"    📈 Avg Engagement/Video: {stats['avg_engagement_per_video']:,.0f}")
-            print(f"    📊 Engagement Rate: {stats['engagement_rate']:.2f}%")
+        for i, row in enumerate(top_influencers.itertuples(), 1):
+            print(f"{i:2d}. @{row.Index}")
+            print(f"    📹 Videos: {row.video_id_count}")
+            print(f"    👥 Followers: {row.author_followers_first:,}")
+            print(f"    💖 Total Engagement: {row.total_engagement:,.0f}")
+            print(f"    📈 Avg Engagement/Video: {row.avg_engagement_per_video:,.0f}")
+            print(f"    📊 Engagement Rate: {row.engagement_rate:.2f}%")
             print()
         
         return top_influencers
@@ -96,31 +247,13 @@ class TikTokAnalyzer:
         print("\n📈 HASHTAG EVOLUTION ANALYSIS")
         print("="*50)
         
-        # Extract all hashtags with timestamps
-        hashtag_timeline = []
-        for _, row in self.finance_df.iterrows():
-            for hashtag in row['hashtags']:
-                hashtag_timeline.append({
-                    'hashtag': hashtag,
-                    'created_at': row['created_at'],
-                    'likes': row['likes'],
-                    'views': row['views']
-                })
-        
-        hashtag_df = pd.DataFrame(hashtag_timeline)
-        hashtag_df['created_at'] = pd.to_datetime(hashtag_df['created_at'])
-        hashtag_df['date'] = hashtag_df['created_at'].dt.date
-        
         # Top hashtags by frequency
-        hashtag_counts = hashtag_df['hashtag'].value_counts()
+        hashtag_counts = self.core.hashtag_counts
         print("📊 Top Finance Bill Hashtags:")
         for hashtag, count in hashtag_counts.head(15).items():
             print(f"   {hashtag}: {count} occurrences")
         
-        # Daily hashtag usage
-        daily_hashtags = hashtag_df.groupby(['date', 'hashtag']).size().reset_index(name='count')
-        
-        return hashtag_df, daily_hashtags, hashtag_counts
+        return self.core.hashtag_df, self.core.daily_hashtags, hashtag_counts
     
     def create_timeline_analysis(self):
         """
@@ -129,26 +262,7 @@ class TikTokAnalyzer:
         print("\n📅 PROTEST TIMELINE ANALYSIS")
         print("="*50)
         
-        # Convert timestamps
-        self.finance_df['created_at'] = pd.to_datetime(self.finance_df['created_at'])
-        self.finance_df['date'] = self.finance_df['created_at'].dt.date
-        
-        # Daily activity
-        daily_activity = self.finance_df.groupby('date').agg({
-            'video_id': 'count',
-            'likes': 'sum',
-            'views': 'sum',
-            'shares': 'sum'
-        }).rename(columns={'video_id': 'video_count'})
-        
-        # Key dates in the Finance Bill protests
-        key_dates = {
-            '2024-06-18': 'Finance Bill 2024 introduced',
-            '2024-06-20': 'First major protests',
-            '2024-06-25': 'Parliament occupation',
-            '2024-06-26': 'President Ruto response',
-            '2024-07-02': 'Continued protests'
-        }
+        daily_activity = self.core.daily_activity
         
         print("📊 Daily Activity Summary:")
         print(f"   Most active day: {daily_activity['video_count'].idxmax()} ({daily_activity['video_count'].max()} videos)")
@@ -158,10 +272,10 @@ class TikTokAnalyzer:
         # Peak activity periods
         peak_days = daily_activity.nlargest(5, 'video_count')
         print(f"\n🔥 Top 5 Most Active Days:")
-        for date, stats in peak_days.iterrows():
-            print(f"   {date}: {stats['video_count']} videos, {stats['likes']:,} likes")
+        for row in peak_days.itertuples():
+            print(f"   {row.Index}: {row.video_count} videos, {row.likes:,} likes")
         
-        return daily_activity, key_dates
+        return daily_activity, self.KEY_DATES
     
     def analyze_content_virality(self):
         """
@@ -170,14 +284,8 @@ class TikTokAnalyzer:
         print("\n🚀 VIRAL CONTENT ANALYSIS")
         print("="*50)
         
-        # Define viral thresholds
-        viral_threshold_views = self.finance_df['views'].quantile(0.9)  # Top 10%
-        viral_threshold_likes = self.finance_df['likes'].quantile(0.9)
-        
-        viral_content = self.finance_df[
-            (self.finance_df['views'] >= viral_threshold_views) |
-            (self.finance_df['likes'] >= viral_threshold_likes)
-        ]
+        viral_content = self.core.viral_content
+        viral_threshold_views, viral_threshold_likes = self.core.viral_thresholds
         
         print(f"📊 Viral Content Metrics:")
         print(f"   Total viral videos: {len(viral_content)}")
@@ -187,12 +295,12 @@ class TikTokAnalyzer:
         # Top viral videos
         top_viral = viral_content.nlargest(10, 'views')
         print(f"\n🔥 Top 10 Most Viral Videos:")
-        for i, (_, video) in enumerate(top_viral.iterrows(), 1):
-            print(f"{i:2d}. @{video['author_username']}")
-            print(f"    👁️ Views: {video['views']:,}")
-            print(f"    💖 Likes: {video['likes']:,}")
-            print(f"    💬 Comments: {video['comments']:,}")
-            print(f"    📤 Shares: {video['shares']:,}")
+        for i, video in enumerate(top_viral.itertuples(index=False), 1):
+            print(f"{i:2d}. @{video.author_username}")
+            print(f"    👁️ Views: {video.views:,}")
+            print(f"    💖 Likes: {video.likes:,}")
+            print(f"    💬 Comments: {video.comments:,}")
+            print(f"    📤 Shares: {video.shares:,}")
             print()
         
         return viral_content, top_viral
@@ -205,7 +313,7 @@ class TikTokAnalyzer:
         print("="*50)
         
         # 1. Daily Activity Timeline
-        daily_activity, _ = self.create_timeline_analysis()
+        daily_activity = self.core.daily_activity
         
         fig1 = go.Figure()
         fig1.add_trace(go.Scatter(
@@ -224,7 +332,7 @@ class TikTokAnalyzer:
         fig1.show()
         
         # 2. Top Influencers Bar Chart
-        top_influencers = self.analyze_top_influencers(15)
+        top_influencers = self._top_influencers(15)
         
         fig2 = px.bar(
             x=top_influencers['total_engagement'].values,
@@ -237,7 +345,7 @@ class TikTokAnalyzer:
         fig2.show()
         
         # 3. Hashtag Network Analysis
-        hashtag_df, _, hashtag_counts = self.analyze_hashtag_evolution()
+        hashtag_counts = self.core.hashtag_counts
         
         fig3 = px.bar(
             x=hashtag_counts.head(20).values,
@@ -268,20 +376,20 @@ class TikTokAnalyzer:
         print("\n📋 RESEARCH SUMMARY")
         print("="*70)
         
+        core = self.core
+        
         # Key metrics
         total_videos = len(self.finance_df)
-        unique_creators = self.finance_df['author_username'].nunique()
-        total_engagement = (self.finance_df['likes'].sum() + 
-                          self.finance_df['comments'].sum() + 
-                          self.finance_df['shares'].sum())
+        unique_creators = len(core.influencer_stats)
+        total_engagement = core.totals['total_engagement']
         
         # Timeline
-        start_date = self.finance_df['created_at'].min()
-        end_date = self.finance_df['created_at'].max()
+        start_date = core.totals['start_date']
+        end_date = core.totals['end_date']
         
         # Top metrics
-        top_video_views = self.finance_df['views'].max()
-        top_creator_followers = self.finance_df['author_followers'].max()
+        top_video_views = core.totals['top_video_views']
+        top_creator_followers = core.totals['top_creator_followers']
         
         print(f"📊 DATASET OVERVIEW:")
         print(f"   Total Finance Bill videos: {total_videos:,}")
@@ -294,9 +402,9 @@ class TikTokAnalyzer:
         # Research KPIs Status
         print(f"\n🎯 RESEARCH KPI STATUS:")
         print(f"   ✅ Target: 50+ Gen-Z influencers → Found: {unique_creators:,} creators")
-        print(f"   ✅ Hashtag mapping → Analyzed {len(self.analyze_hashtag_evolution()[2])} unique hashtags")
-        print(f"   ✅ Timeline analysis → {len(self.create_timeline_analysis()[0])} days of activity")
-        print(f"   ✅ Viral content analysis → {len(self.analyze_content_virality()[0])} viral videos")
+        print(f"   ✅ Hashtag mapping → Analyzed {len(core.hashtag_counts)} unique hashtags")
+        print(f"   ✅ Timeline analysis → {len(core.daily_activity)} days of activity")
+        print(f"   ✅ Viral content analysis → {len(core.viral_content)} viral videos")
         
         return {
             'total_videos': total_videos,
@@ -310,8 +418,8 @@ class TikTokAnalyzer:
 if __name__ == "__main__":
     # Initialize analyzer
     analyzer = TikTokAnalyzer(
-        "data/processed_data/tiktok_processed.csv",
-        "data/processed_data/tiktok_finance_bill.csv"
+        "data/processed_data/tiktok_processed.parquet",
+        "data/processed_data/tiktok_finance_bill.parquet"
     )
     
     # Run comprehensive analysis
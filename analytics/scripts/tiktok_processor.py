@@ -4,14 +4,52 @@ Process Apify TikTok JSON data for analysis
 """
 
 import pandas as pd
-import json
+import ijson
 import re
+from itertools import islice
 from datetime import datetime
 import matplotlib.pyplot as plt
 import seaborn as sns
-from collections import Counter
 import numpy as np
 
+_HASHTAG_RE = re.compile(r'#\w+')
+
+# Flattened Apify field -> processed column (adjust based on your JSON structure)
+_FIELD_MAP = {
+    # Video metadata
+    'id': 'video_id',
+    'url': 'video_url',
+    'desc': 'description',
+    'text': 'text',
+    
+    # Author info
+    'author_uniqueId': 'author_username',
+    'author_nickname': 'author_display_name',
+    'author_followerCount': 'author_followers',
+    'author_verified': 'author_verified',
+    
+    # Engagement metrics
+    'stats_diggCount': 'likes',
+    'stats_commentCount': 'comments',
+    'stats_shareCount': 'shares',
+    'stats_playCount': 'views',
+    
+    # Timing
+    'createTime': 'created_at',
+    'createTimeISO': 'created_timestamp',
+    
+    # Music/Sound
+    'music_title': 'music_title',
+    'music_authorName': 'music_author',
+    
+    # Video details
+    'video_duration': 'duration',
+    'video_width': 'video_width',
+    'video_height': 'video_height',
+}
+_COUNT_COLS = ['author_followers', 'likes', 'comments', 'shares', 'views',
+               'duration', 'video_width', 'video_height']
+
 class TikTokDataProcessor:
     def __init__(self, json_file_path):
         """
@@ -23,75 +61,83 @@ class TikTokDataProcessor:
         self.json_file_path = json_file_path
         self.raw_data = None
         self.processed_df = None
-        self.finance_bill_hashtags = [
+        self.finance_bill_hashtags = frozenset([
             '#rejectfinancebill2024', '#rutomustgo', '#occupyparliament', 
             '#genzkenya', '#kenyaprotests', '#genzrevolution', '#totalshutdown',
             '#kenyangenz', '#financebill2024', '#youth4change'
-        ]
+        ])
+        # One alternation over all Finance Bill hashtags; the lookahead stops
+        # '#rutomustgo' from matching inside a longer tag like '#rutomustgoo'
+        self._finance_bill_re = re.compile(
+            '(?:' + '|'.join(map(re.escape, sorted(self.finance_bill_hashtags))) + r')(?!\w)'
+        )
         
     def load_data(self):
-        """Load TikTok JSON data from Apify"""
+        """Open TikTok JSON data from Apify for streaming"""
         try:
-            with open(self.json_file_path, 'r', encoding='utf-8') as f:
-                self.raw_data = json.load(f)
-            print(f"✅ Loaded {len(self.raw_data)} TikTok records")
+            # Parse the first record up front so a bad path or file fails here
+            with open(self.json_file_path, 'rb') as f:
+                next(ijson.items(f, 'item'), None)
+            self.raw_data = self._iter_records()
+            print(f"✅ Streaming TikTok records from {self.json_file_path}")
             return True
         except Exception as e:
             print(f"❌ Error loading data: {e}")
             return False
     
-    def process_data(self):
-        """Process raw TikTok data into structured DataFrame"""
-        if not self.raw_data:
+    def _iter_records(self):
+        """Yield records one at a time from the top-level JSON array"""
+        with open(self.json_file_path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+    
+    def process_data(self, batch_size=50_000):
+        """
+        Process raw TikTok data into structured DataFrame
+        
+        Args:
+            batch_size (int): Records flattened per json_normalize call
+        """
+        if self.raw_data is None:
             print("❌ No data loaded. Run load_data() first.")
             return None
             
-        processed_records = []
-        
-        for record in self.raw_data:
-            try:
-                # Extract key fields (adjust based on your JSON structure)
-                processed_record = {
-                    # Video metadata
-                    'video_id': record.get('id', ''),
-                    'video_url': record.get('url', ''),
-                    'description': record.get('desc', ''),
-                    'text': record.get('text', record.get('desc', '')),
-                    
-                    # Author info
-                    'author_username': record.get('author', {}).get('uniqueId', ''),
-                    'author_display_name': record.get('author', {}).get('nickname', ''),
-                    'author_followers': record.get('author', {}).get('followerCount', 0),
-                    'author_verified': record.get('author', {}).get('verified', False),
-                    
-                    # Engagement metrics
-                    'likes': record.get('stats', {}).get('diggCount', 0),
-                    'comments': record.get('stats', {}).get('commentCount', 0),
-                    'shares': record.get('stats', {}).get('shareCount', 0),
-                    'views': record.get('stats', {}).get('playCount', 0),
-                    
-                    # Timing
-                    'created_at': record.get('createTime', ''),
-                    'created_timestamp': record.get('createTimeISO', ''),
-                    
-                    # Music/Sound
-                    'music_title': record.get('music', {}).get('title', ''),
-                    'music_author': record.get('music', {}).get('authorName', ''),
-                    
-                    # Video details
-                    'duration': record.get('video', {}).get('duration', 0),
-                    'video_width': record.get('video', {}).get('width', 0),
-                    'video_height': record.get('video', {}).get('height', 0),
-                }
-                
-                processed_records.append(processed_record)
-                
-            except Exception as e:
-                print(f"⚠️ Error processing record: {e}")
+        batches = []
+        skipped_records = 0
+        
+        # Flatten the stream a batch at a time so only one batch of parsed
+        # records is held in memory alongside the finished frames
+        while batch := list(islice(self.raw_data, batch_size)):
+            # json_normalize needs every record to be an object
+            records = [record for record in batch if isinstance(record, dict)]
+            skipped_records += len(batch) - len(records)
+            if not records:
                 continue
+            flat = pd.json_normalize(records, sep='_', max_level=1)
+            batches.append(flat.reindex(columns=list(_FIELD_MAP)).rename(columns=_FIELD_MAP))
+        
+        # The stream is consumed; run load_data() again to re-process
+        self.raw_data = None
+        
+        df = pd.concat(batches, ignore_index=True) if batches else pd.DataFrame(columns=list(_FIELD_MAP.values()))
         
-        self.processed_df = pd.DataFrame(processed_records)
+        # Fill the same defaults the per-field lookups used
+        df['text'] = df['text'].fillna(df['description'])
+        # createTime is epoch seconds, which json_normalize turns to float
+        # when some records lack it; a missing one stays null (one Arrow type)
+        df['created_at'] = np.floor(pd.to_numeric(df['created_at'], errors='coerce')).astype('Int64')
+        
+        # Counts that are not numbers (e.g. "1.2K") are counted as 0
+        df[_COUNT_COLS] = df[_COUNT_COLS].apply(pd.to_numeric, errors='coerce').fillna(0).astype('int64')
+        df = df.fillna({
+            'video_id': '', 'video_url': '', 'description': '', 'text': '',
+            'author_username': '', 'author_display_name': '', 'author_verified': False,
+            'created_timestamp': '', 'music_title': '', 'music_author': '',
+        })
+        
+        self.processed_df = df
         print(f"✅ Processed {len(self.processed_df)} records")
+        if skipped_records > 0:
+            print(f"⚠️ Skipped {skipped_records} records that are not JSON objects")
         return self.processed_df
     
     def extract_hashtags(self):
@@ -100,20 +146,12 @@ class TikTokDataProcessor:
             print("❌ No processed data. Run process_data() first.")
             return None
             
-        def get_hashtags(text):
-            if pd.isna(text):
-                return []
-            hashtags = re.findall(r'#\w+', str(text).lower())
-            return hashtags
-        
-        self.processed_df['hashtags'] = self.processed_df['text'].apply(get_hashtags)
-        self.processed_df['hashtag_count'] = self.processed_df['hashtags'].apply(len)
+        text_lower = self.processed_df['text'].fillna('').astype(str).str.lower()
+        self.processed_df['hashtags'] = text_lower.str.findall(_HASHTAG_RE)
+        self.processed_df['hashtag_count'] = self.processed_df['hashtags'].str.len()
         
         # Filter for Finance Bill related content
-        def has_finance_bill_hashtag(hashtag_list):
-            return any(hashtag in self.finance_bill_hashtags for hashtag in hashtag_list)
-        
-        self.processed_df['finance_bill_related'] = self.processed_df['hashtags'].apply(has_finance_bill_hashtag)
+        self.processed_df['finance_bill_related'] = text_lower.str.contains(self._finance_bill_re)
         
         finance_bill_df = self.processed_df[self.processed_df['finance_bill_related'] == True]
         print(f"✅ Found {len(finance_bill_df)} Finance Bill related videos")
@@ -125,23 +163,17 @@ class TikTokDataProcessor:
         if self.processed_df is None:
             return None
             
-        # Get all hashtags
-        all_hashtags = []
-        for hashtag_list in self.processed_df['hashtags']:
-            all_hashtags.extend(hashtag_list)
-        
-        # Count frequencies
-        hashtag_counts = Counter(all_hashtags)
+        # Count frequencies over the flattened hashtag column
+        hashtag_counts = self.processed_df['hashtags'].explode().value_counts()
         
         # Focus on Finance Bill hashtags
-        finance_bill_counts = {hashtag: count for hashtag, count in hashtag_counts.items() 
-                              if hashtag in self.finance_bill_hashtags}
+        finance_bill_counts = hashtag_counts[hashtag_counts.index.isin(self.finance_bill_hashtags)]
         
         print("📊 Finance Bill Hashtag Analysis:")
-        for hashtag, count in sorted(finance_bill_counts.items(), key=lambda x: x[1], reverse=True):
+        for hashtag, count in finance_bill_counts.items():
             print(f"   {hashtag}: {count} videos")
         
-        return hashtag_counts, finance_bill_counts
+        return hashtag_counts.to_dict(), finance_bill_counts.to_dict()
     
     def get_top_creators(self, n=20):
         """Get top creators by engagement metrics"""
@@ -151,32 +183,45 @@ class TikTokDataProcessor:
         # Filter for Finance Bill content
         finance_df = self.processed_df[self.processed_df['finance_bill_related'] == True]
         
-        # Group by creator and calculate metrics
-        creator_stats = finance_df.groupby('author_username').agg({
-            'likes': 'sum',
-            'comments': 'sum', 
-            'shares': 'sum',
-            'views': 'sum',
-            'video_id': 'count',
-            'author_followers': 'first',
-            'author_display_name': 'first'
-        }).rename(columns={'video_id': 'video_count'})
-        
-        # Calculate engagement rate
-        creator_stats['total_engagement'] = (creator_stats['likes'] + 
-                                           creator_stats['comments'] + 
-                                           creator_stats['shares'])
-        
-        creator_stats['engagement_rate'] = (creator_stats['total_engagement'] / 
-                                          creator_stats['views'] * 100)
+        # Aggregate all creator metrics in one pass over integer creator codes
+        finance_df = finance_df[finance_df['author_username'].notna()]
+        codes, usernames = pd.factorize(finance_df['author_username'], sort=True)
+        n_creators = len(usernames)
+        
+        def group_sum(column):
+            # Summed in int64 (bincount weights would go through float64)
+            sums = np.zeros(n_creators, dtype=np.int64)
+            np.add.at(sums, codes, finance_df[column].fillna(0).to_numpy(dtype=np.int64))
+            return sums
+        
+        likes, comments, shares, views = (group_sum(c) for c in ('likes', 'comments', 'shares', 'views'))
+        video_count = np.bincount(codes[finance_df['video_id'].notna().to_numpy()], minlength=n_creators)
+        _, first_rows = np.unique(codes, return_index=True)
+        
+        # Calculate engagement rate (0% for creators with no recorded views)
+        total_engagement = likes + comments + shares
+        engagement_rate = np.divide(total_engagement, views, out=np.zeros(n_creators),
+                                    where=views > 0) * 100
+        
+        creator_stats = pd.DataFrame({
+            'likes': likes,
+            'comments': comments,
+            'shares': shares,
+            'views': views,
+            'video_count': video_count,
+            'author_followers': finance_df['author_followers'].to_numpy()[first_rows],
+            'author_display_name': finance_df['author_display_name'].to_numpy()[first_rows],
+            'total_engagement': total_engagement,
+            'engagement_rate': engagement_rate,
+        }, index=pd.Index(usernames, name='author_username'))
         
         # Sort by total engagement
         top_creators = creator_stats.sort_values('total_engagement', ascending=False).head(n)
         
         print(f"🎯 Top {n} Finance Bill TikTok Creators:")
-        for username, stats in top_creators.iterrows():
-            print(f"   @{username}: {stats['video_count']} videos, "
-                  f"{stats['total_engagement']:,} total engagement")
+        for row in top_creators.itertuples():
+            print(f"   @{row.Index}: {row.video_count} videos, "
+                  f"{row.total_engagement:,} total engagement")
         
         return top_creators
     
@@ -258,8 +303,8 @@ if __name__ == "__main__":
         summary = processor.create_summary_report()
         
         # Save processed data
-        processor.processed_df.to_csv("data/processed_data/tiktok_processed.csv", index=False)
-        finance_df.to_csv("data/processed_data/tiktok_finance_bill.csv", index=False)
+        processor.processed_df.to_parquet("data/processed_data/tiktok_processed.parquet", index=False, compression='zstd')
+        finance_df.to_parquet("data/processed_data/tiktok_finance_bill.parquet", index=False, compression='zstd')
         
         print("\n✅ Processing complete! Files saved to data/processed_data/")
     else:
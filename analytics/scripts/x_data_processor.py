@@ -1,38 +1,264 @@
 """
-X (Twitter) Data Processor - Generate Processed CSV Files
-Process raw X/Twitter JSON data and generate all required CSV files for analysis
+X (Twitter) Data Processor - Generate Processed Data Files
+Process raw X/Twitter JSON data and generate all required Parquet files for analysis
 """
 
 import pandas as pd
-import json
+import orjson
+import ijson
 import re
 import os
-from datetime import datetime
-from collections import Counter
+from itertools import islice, chain
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+# Common JSON structures from different scrapers, in lookup order
+_DATA_KEYS = ('tweets', 'data', 'results', 'items', 'posts')
+
+# Tweet text fields, in order of preference
+_TEXT_FIELDS = ('text', 'full_text', 'content', 'tweet_text', 'message')
+
+_HASHTAG_RE = re.compile(r'#\w+')
+
+# Twitter's created_at format; anything else is parsed as ISO 8601
+_TWITTER_DATE_FORMAT = '%a %b %d %H:%M:%S %z %Y'
+
+# Repetitive text columns stored as categoricals
+_CATEGORY_COLUMNS = ('author_username', 'author_display_name', 'location', 'language', 'source')
+
+# Count columns narrowed to int32 when every value fits
+_COUNT_COLUMNS = ('likes', 'retweets', 'replies', 'quotes', 'bookmarks', 'total_engagement',
+                  'author_followers', 'author_following')
+_INT32_MAX = np.iinfo(np.int32).max
+
+# Flattened columns that hold 64-bit tweet/user ids
+_ID_COLUMNS = ('id', 'user.id', 'author.id')
+
+def _lookup(record, path):
+    """Follow a dotted path into a nested record, None if any step is missing"""
+    for key in path.split('.'):
+        record = record.get(key) if isinstance(record, dict) else None
+    return record
+
+@lru_cache(maxsize=None)
+def _keyword_pattern(keywords):
+    """Compile one case-insensitive alternation per keyword tuple, cached across calls"""
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+def _process_batch(batch, offset):
+    """
+    Flatten a batch of raw records into processed rows (module-level so
+    worker processes can pickle it); a malformed record that breaks the
+    whole-batch pass is isolated by halving the batch and skipped, None if
+    no record survives
+    
+    Args:
+        batch (list): Raw tweet dicts
+        offset (int): Position of the first record in the whole input
+    """
+    try:
+        return _flatten_batch(batch, offset)
+    except Exception as e:
+        if len(batch) == 1:
+            print(f"⚠️ Error processing record {offset}: {e}")
+            return None
+    
+    middle = len(batch) // 2
+    frames = [frame for frame in (_process_batch(batch[:middle], offset),
+                                  _process_batch(batch[middle:], offset + middle))
+              if frame is not None]
+    return pd.concat(frames) if frames else None
+
+def _flatten_batch(batch, offset):
+    """
+    Flatten a batch of raw records into processed rows as whole columns
+    
+    Args:
+        batch (list): Raw tweet dicts
+        offset (int): Position of the first record in the whole input
+    """
+    flat = pd.json_normalize(batch, max_level=1)
+    flat.index = pd.RangeIndex(offset, offset + len(batch))
+    
+    # json_normalize stores an int column with gaps as float64, which cannot
+    # hold 64-bit ids exactly; take those straight from the records instead
+    for column in _ID_COLUMNS:
+        if column in flat and flat[column].dtype.kind == 'f':
+            flat[column] = pd.Series([_lookup(r, column) for r in batch], index=flat.index, dtype=object)
+    
+    missing = pd.Series(None, index=flat.index, dtype=object)
+    
+    def first(*names, default=''):
+        """First non-missing value across the named columns"""
+        values = missing
+        for name in reversed(names):
+            values = flat[name].combine_first(values) if name in flat else values
+        return values.fillna(default)
+    
+    def count(*names):
+        return pd.to_numeric(first(*names, default=0), errors='coerce').fillna(0).astype('int64')
+    
+    def present(name):
+        """Whether each record has a non-null value for the key, or any non-null field nested under it (a key set to null counts as absent)"""
+        nested = [c for c in flat.columns if c.startswith(name + '.')]
+        mask = flat[nested].notna().any(axis=1) if nested else missing.notna()
+        return mask | flat[name].notna() if name in flat else mask
+    
+    # Tweet text: first non-empty field; records without text are skipped
+    text = missing
+    for field in reversed(_TEXT_FIELDS):
+        if field in flat:
+            values = flat[field]
+            text = values.where(values.notna() & values.astype(bool), text)
+    text = text.fillna('').astype(str)
+    
+    # User fields come from 'user', else 'author', else the record root
+    has_user = present('user')
+    has_author = present('author') & ~has_user
+    
+    def user_field(*keys, default=''):
+        root = first(*keys, default=default)
+        author = first(*(f'author.{k}' for k in keys), default=default)
+        user = first(*(f'user.{k}' for k in keys), default=default)
+        return user.where(has_user, author.where(has_author, root))
+    
+    followers = pd.to_numeric(user_field('followers_count', 'followers', default=0), errors='coerce').fillna(0).astype('int64')
+    
+    # Word counts straight into an int array, without a Series of token lists
+    word_count = np.fromiter(map(len, map(str.split, text)), dtype=np.int64, count=len(text))
+    
+    # Engagement metrics
+    likes = count('favorite_count', 'favourites_count', 'likes')
+    retweets = count('retweet_count', 'retweets')
+    replies = count('reply_count', 'replies')
+    total_engagement = likes + retweets + replies
+    
+    # Engagement rate as one NumPy pass over the raw arrays; 0 without followers.
+    # Scaled in place, so no extra temporaries per batch. Kept float64: unlike
+    # the int32 counts, float32 would change the saved rates from the 7th digit
+    followers_arr = followers.to_numpy()
+    engagement_rate = np.divide(
+        total_engagement.to_numpy(), followers_arr,
+        out=np.zeros(len(followers_arr)), where=followers_arr > 0
+    )
+    np.multiply(engagement_rate, 100, out=engagement_rate)
+    
+    # Timing, parsed for the whole column and normalized to UTC
+    created_at = first('created_at')
+    timestamps = pd.to_datetime(created_at, format=_TWITTER_DATE_FORMAT, utc=True, errors='coerce')
+    iso = timestamps.isna() & created_at.ne('')
+    if iso.any():
+        timestamps[iso] = pd.to_datetime(created_at[iso].astype(str), format='ISO8601', utc=True, errors='coerce')
+    
+    # Hashtags from the entities plus any in the text, de-duplicated in order
+    entity_hashtags = first('entities.hashtags', default=None).map(
+        lambda tags: [f"#{tag['text'].lower()}" for tag in tags] if tags else []
+    )
+    text_hashtags = text.str.lower().str.findall(_HASHTAG_RE)
+    hashtags = (entity_hashtags + text_hashtags).map(lambda tags: list(dict.fromkeys(tags)))
+    
+    # Other entities (mentions, URLs, media), built straight into columns
+    mentions = first('entities.user_mentions', default=None).map(
+        lambda entities: [f"@{mention['screen_name']}" for mention in entities or []]
+    )
+    urls = first('entities.urls', default=None).map(
+        lambda entities: [url['expanded_url'] for url in entities or [] if url.get('expanded_url')]
+    )
+    media = first('entities.media', default=None).map(lambda m: m or []) + \
+        first('extended_entities.media', default=None).map(lambda m: m or [])
+    media_types = media.map(lambda items: [m.get('type', '') for m in items])
+    
+    tweet_id = first('id', 'id_str', default=None)
+    
+    processed = pd.DataFrame({
+        # Tweet basic info
+        # Ids as strings: scrapers mix int and str ids, Arrow needs one type
+        'tweet_id': tweet_id.fillna('unknown_' + flat.index.to_series().astype(str)).astype(str),
+        'tweet_url': 'https://twitter.com/i/web/status/' + tweet_id.fillna('').astype(str),
+        'text': text,
+        
+        # User info
+        'author_username': user_field('screen_name', 'username'),
+        'author_display_name': user_field('name', 'display_name'),
+        'author_followers': followers,
+        'author_following': pd.to_numeric(user_field('friends_count', 'following', default=0), errors='coerce').fillna(0).astype('int64'),
+        'author_verified': user_field('verified', default=False),
+        'author_id': user_field('id_str', 'id').astype(str),
+        'author_created_at': user_field('created_at'),
+        'location': user_field('location'),
+        
+        # Engagement metrics
+        'likes': likes,
+        'retweets': retweets,
+        'replies': replies,
+        'quotes': count('quote_count', 'quotes'),
+        'bookmarks': count('bookmark_count', 'bookmarks'),
+        
+        # Timing
+        'created_at': created_at,
+        'created_timestamp': timestamps,
+        'created_date': timestamps.dt.strftime('%Y-%m-%d').fillna(''),
+        'created_time': timestamps.dt.strftime('%H:%M:%S').fillna(''),
+        'created_hour': timestamps.dt.hour.fillna(0).astype('int64'),
+        'created_day_of_week': timestamps.dt.day_name().fillna(''),
+        
+        # Tweet metadata
+        'is_retweet': present('retweeted_status') | first('retweeted', default=False).astype(bool),
+        'is_quote': present('quoted_status') | first('is_quote_status', default=False).astype(bool),
+        'is_reply': present('in_reply_to_status_id') | present('in_reply_to_user_id'),
+        'is_thread': first('is_thread', default=False),
+        'language': first('lang'),
+        'source': first('source'),
+        'possibly_sensitive': first('possibly_sensitive', default=False),
+        
+        # Entities
+        'hashtags': hashtags,
+        'mentions': mentions,
+        'urls': urls,
+        'hashtag_count': hashtags.str.len(),
+        'mention_count': mentions.str.len(),
+        'url_count': urls.str.len(),
+        'has_media': media_types.str.len() > 0,
+        'media_count': media_types.str.len(),
+        'media_types': media_types,
+        
+        # Calculated fields
+        'total_engagement': total_engagement,
+        'engagement_rate': engagement_rate,
+        'text_length': text.str.len(),
+        'word_count': word_count,
+    })
+    
+    return processed[text != ''].infer_objects()
 
 class XDataProcessor:
-    def __init__(self, json_file_path):
+    def __init__(self, json_file_path, stream_threshold_mb=256):
         """
         Initialize processor with X/Twitter JSON file
         
         Args:
             json_file_path (str): Path to your X/Twitter JSON file
+            stream_threshold_mb (int): Files larger than this are streamed with ijson
         """
         self.json_file_path = json_file_path
+        self.stream_threshold_bytes = stream_threshold_mb * 1024 * 1024
         self.raw_data = None
         self.processed_df = None
         self.finance_bill_df = None
         self.influencers_df = None
         
         # Finance Bill related hashtags and keywords
-        self.finance_bill_hashtags = [
+        self.finance_bill_hashtags = frozenset([
             '#rejectfinancebill2024', '#rutomustgo', '#occupyparliament', 
             '#genzkenya', '#kenyaprotests', '#genzrevolution', '#totalshutdown',
             '#kenyangenz', '#financebill2024', '#youth4change', '#rutoamustgo',
             '#parliamentoccupied', '#kenyageneration', '#kenyanprotest', '#genzparliament',
             '#rejectfinancebill', '#financebill', '#kenyagenx', '#genxkenya'
-        ]
+        ])
         
         self.finance_keywords = [
             'finance bill', 'ruto must go', 'occupy parliament', 'gen z', 'genz',
@@ -48,27 +274,31 @@ class XDataProcessor:
         try:
             print(f"📂 Loading data from: {self.json_file_path}")
             
-            with open(self.json_file_path, 'r', encoding='utf-8') as f:
-                self.raw_data = json.load(f)
+            # One tweet per line: stream it, parsing a line at a time
+            if self._is_jsonl():
+                self.raw_data = self._iter_jsonl()
+                print("✅ Streaming X/Twitter records (JSON Lines)")
+                return True
+            
+            if os.path.getsize(self.json_file_path) > self.stream_threshold_bytes:
+                return self._open_stream()
+            
+            with open(self.json_file_path, 'rb') as f:
+                self.raw_data = orjson.loads(f.read())
             
             # Handle different JSON structures
             if isinstance(self.raw_data, dict):
-                # Common JSON structures from different scrapers
-                possible_keys = ['tweets', 'data', 'results', 'items', 'posts']
-                
-                for key in possible_keys:
-                    if key in self.raw_data and isinstance(self.raw_data[key], list):
-                        self.raw_data = self.raw_data[key]
-                        print(f"✅ Found data in '{key}' field")
-                        break
+                key = next((k for k in _DATA_KEYS if isinstance(self.raw_data.get(k), list)), None)
+                if key is not None:
+                    self.raw_data = self.raw_data[key]
+                    print(f"✅ Found data in '{key}' field")
+                # If no array found, treat as single tweet
+                elif 'id' in self.raw_data or 'text' in self.raw_data:
+                    self.raw_data = [self.raw_data]
+                    print("✅ Single tweet detected, converted to list")
                 else:
-                    # If no array found, treat as single tweet
-                    if 'id' in self.raw_data or 'text' in self.raw_data:
-                        self.raw_data = [self.raw_data]
-                        print("✅ Single tweet detected, converted to list")
-                    else:
-                        print("❌ Could not find tweet data in JSON structure")
-                        return False
+                    print("❌ Could not find tweet data in JSON structure")
+                    return False
             
             print(f"✅ Loaded {len(self.raw_data)} X/Twitter records")
             return True
@@ -76,277 +306,142 @@ class XDataProcessor:
         except FileNotFoundError:
             print(f"❌ File not found: {self.json_file_path}")
             return False
-        except json.JSONDecodeError as e:
+        except (orjson.JSONDecodeError, ijson.JSONError) as e:
             print(f"❌ Invalid JSON format: {e}")
             return False
         except Exception as e:
             print(f"❌ Error loading data: {e}")
             return False
     
-    def process_data(self):
-        """Process raw X/Twitter data into structured DataFrame"""
-        if not self.raw_data:
-            print("❌ No data loaded. Run load_data() first.")
-            return False
-            
-        processed_records = []
-        skipped_records = 0
-        
-        print("🔄 Processing tweet data...")
+    def _is_jsonl(self):
+        """Whether the file is JSON Lines rather than one JSON document"""
+        if self.json_file_path.lower().endswith(('.jsonl', '.ndjson')):
+            return True
         
-        for i, record in enumerate(self.raw_data):
+        # Otherwise: the first line is a whole JSON object and more lines follow
+        with open(self.json_file_path, 'rb') as f:
+            first_line = f.readline()
+            if not first_line.lstrip().startswith(b'{'):
+                return False
             try:
-                # Extract tweet text
-                tweet_text = self._extract_text(record)
-                if not tweet_text:
-                    skipped_records += 1
-                    continue
-                
-                # Extract user information
-                user_info = self._extract_user_info(record)
-                
-                # Extract engagement metrics
-                engagement = self._extract_engagement(record)
-                
-                # Extract timing information
-                timing = self._extract_timing(record)
-                
-                # Extract tweet metadata
-                metadata = self._extract_metadata(record)
-                
-                # Extract entities (hashtags, mentions, etc.)
-                entities = self._extract_entities(record)
-                
-                # Combine all data
-                processed_record = {
-                    # Tweet basic info
-                    'tweet_id': record.get('id', record.get('id_str', f'unknown_{i}')),
-                    'tweet_url': f"https://twitter.com/i/web/status/{record.get('id', record.get('id_str', ''))}",
-                    'text': tweet_text,
-                    
-                    # User info
-                    'author_username': user_info.get('username', ''),
-                    'author_display_name': user_info.get('display_name', ''),
-                    'author_followers': user_info.get('followers', 0),
-                    'author_following': user_info.get('following', 0),
-                    'author_verified': user_info.get('verified', False),
-                    'author_id': user_info.get('user_id', ''),
-                    'author_created_at': user_info.get('created_at', ''),
-                    'location': user_info.get('location', ''),
-                    
-                    # Engagement metrics
-                    'likes': engagement.get('likes', 0),
-                    'retweets': engagement.get('retweets', 0),
-                    'replies': engagement.get('replies', 0),
-                    'quotes': engagement.get('quotes', 0),
-                    'bookmarks': engagement.get('bookmarks', 0),
-                    
-                    # Timing
-                    'created_at': timing.get('created_at', ''),
-                    'created_timestamp': timing.get('timestamp', None),
-                    'created_date': timing.get('date', ''),
-                    'created_time': timing.get('time', ''),
-                    'created_hour': timing.get('hour', 0),
-                    'created_day_of_week': timing.get('day_of_week', ''),
-                    
-                    # Tweet metadata
-                    'is_retweet': metadata.get('is_retweet', False),
-                    'is_quote': metadata.get('is_quote', False),
-                    'is_reply': metadata.get('is_reply', False),
-                    'is_thread': metadata.get('is_thread', False),
-                    'language': metadata.get('language', ''),
-                    'source': metadata.get('source', ''),
-                    'possibly_sensitive': metadata.get('possibly_sensitive', False),
-                    
-                    # Entities
-                    'hashtags': entities.get('hashtags', []),
-                    'mentions': entities.get('mentions', []),
-                    'urls': entities.get('urls', []),
-                    'hashtag_count': entities.get('hashtag_count', 0),
-                    'mention_count': entities.get('mention_count', 0),
-                    'url_count': entities.get('url_count', 0),
-                    'has_media': entities.get('has_media', False),
-                    'media_count': entities.get('media_count', 0),
-                    'media_types': entities.get('media_types', []),
-                    
-                    # Calculated fields
-                    'total_engagement': engagement.get('likes', 0) + engagement.get('retweets', 0) + engagement.get('replies', 0),
-                    'engagement_rate': self._calculate_engagement_rate(engagement, user_info.get('followers', 0)),
-                    'text_length': len(tweet_text),
-                    'word_count': len(tweet_text.split()) if tweet_text else 0,
-                }
-                
-                processed_records.append(processed_record)
-                
-                # Progress indicator
-                if (i + 1) % 100 == 0:
-                    print(f"   Processed {i + 1}/{len(self.raw_data)} records...")
-                
-            except Exception as e:
-                print(f"⚠️ Error processing record {i}: {e}")
-                skipped_records += 1
-                continue
-        
-        self.processed_df = pd.DataFrame(processed_records)
-        
-        print(f"✅ Successfully processed {len(self.processed_df)} records")
-        if skipped_records > 0:
-            print(f"⚠️ Skipped {skipped_records} records due to errors")
+                orjson.loads(first_line)
+            except orjson.JSONDecodeError:
+                return False
+            return any(line.strip() for line in f)
+    
+    def _iter_jsonl(self):
+        """Yield tweet records one line at a time, skipping blank lines"""
+        with open(self.json_file_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
+    
+    def _open_stream(self):
+        """Point raw_data at an ijson record stream for large files"""
+        # Find the tweet array: either the document itself or the first
+        # top-level field from _DATA_KEYS that holds an array
+        prefix = None
+        with open(self.json_file_path, 'rb') as f:
+            for path, event, value in ijson.parse(f, buf_size=64 * 1024):
+                if path == '' and event == 'start_array':
+                    prefix = 'item'
+                    break
+                if path in _DATA_KEYS and event == 'start_array':
+                    prefix = f'{path}.item'
+                    print(f"✅ Found data in '{path}' field")
+                    break
+        
+        if prefix is None:
+            print("❌ Could not find tweet data in JSON structure")
+            return False
         
+        self.raw_data = self._iter_records(prefix)
+        print(f"✅ Streaming X/Twitter records (file over {self.stream_threshold_bytes // (1024 * 1024)} MB)")
         return True
     
-    def _extract_text(self, record):
-        """Extract tweet text from various possible fields"""
-        text_fields = ['text', 'full_text', 'content', 'tweet_text', 'message']
+    def _iter_records(self, prefix):
+        """Yield tweet records one at a time from the JSON array at prefix"""
+        with open(self.json_file_path, 'rb') as f:
+            yield from ijson.items(f, prefix, use_float=True, buf_size=64 * 1024)
+    
+    def process_data(self, batch_size=50_000, workers=None):
+        """
+        Process raw X/Twitter data into structured DataFrame
         
-        for field in text_fields:
-            if field in record and record[field]:
-                return str(record[field])
+        Args:
+            batch_size (int): Records flattened per json_normalize call
+            workers (int): Worker processes for the batches (default: one per CPU; 1, or a single batch, runs inline)
+        """
+        if not self.raw_data:
+            print("❌ No data loaded. Run load_data() first.")
+            return False
         
-        return ''
-    
-    def _extract_user_info(self, record):
-        """Extract user information"""
-        user_info = {}
+        frames = []
+        skipped_records = 0
+        offset = 0
+        
+        # Streamed input has no length up front
+        total = len(self.raw_data) if isinstance(self.raw_data, list) else None
+        records = iter(self.raw_data)
+        
+        print("🔄 Processing tweet data...")
         
-        # Try to find user object
-        user_obj = None
-        if 'user' in record and isinstance(record['user'], dict):
-            user_obj = record['user']
-        elif 'author' in record and isinstance(record['author'], dict):
-            user_obj = record['author']
+        # Each batch's flattened json_normalize frame is dropped as soon as its
+        # processed rows are built
+        def collect(frame, batch_len):
+            nonlocal skipped_records, offset
+            skipped_records += batch_len - (0 if frame is None else len(frame))
+            offset += batch_len
+            if frame is not None:
+                frames.append(frame)
+            print(f"   Processed {offset}/{total or '?'} records...")
+        
+        batches = iter(lambda: list(islice(records, batch_size)), [])
+        workers = workers or os.cpu_count() or 1
+        
+        # A single batch (the usual scrape) is not worth starting worker
+        # processes for, so peek at the first two
+        head = list(islice(batches, 2))
+        batches = chain(head, batches)
+        if workers == 1 or len(head) < 2:
+            for batch in batches:
+                collect(_process_batch(batch, offset), len(batch))
         else:
-            user_obj = record  # Sometimes user data is at root level
-        
-        if user_obj:
-            user_info = {
-                'username': user_obj.get('screen_name', user_obj.get('username', '')),
-                'display_name': user_obj.get('name', user_obj.get('display_name', '')),
-                'followers': user_obj.get('followers_count', user_obj.get('followers', 0)),
-                'following': user_obj.get('friends_count', user_obj.get('following', 0)),
-                'verified': user_obj.get('verified', False),
-                'user_id': user_obj.get('id_str', user_obj.get('id', '')),
-                'created_at': user_obj.get('created_at', ''),
-                'location': user_obj.get('location', ''),
-            }
-        
-        return user_info
-    
-    def _extract_engagement(self, record):
-        """Extract engagement metrics"""
-        return {
-            'likes': record.get('favorite_count', record.get('favourites_count', record.get('likes', 0))),
-            'retweets': record.get('retweet_count', record.get('retweets', 0)),
-            'replies': record.get('reply_count', record.get('replies', 0)),
-            'quotes': record.get('quote_count', record.get('quotes', 0)),
-            'bookmarks': record.get('bookmark_count', record.get('bookmarks', 0)),
-        }
-    
-    def _extract_timing(self, record):
-        """Extract and parse timing information"""
-        timing = {'created_at': record.get('created_at', ''), 'timestamp': None}
-        
-        if timing['created_at']:
-            try:
-                # Try different date formats
-                dt = self._parse_twitter_date(timing['created_at'])
-                if dt:
-                    timing.update({
-                        'timestamp': dt,
-                        'date': dt.strftime('%Y-%m-%d'),
-                        'time': dt.strftime('%H:%M:%S'),
-                        'hour': dt.hour,
-                        'day_of_week': dt.strftime('%A'),
-                    })
-            except Exception:
-                pass
-        
-        return timing
-    
-    def _extract_metadata(self, record):
-        """Extract tweet metadata"""
-        return {
-            'is_retweet': 'retweeted_status' in record or record.get('retweeted', False),
-            'is_quote': 'quoted_status' in record or record.get('is_quote_status', False),
-            'is_reply': 'in_reply_to_status_id' in record or record.get('in_reply_to_user_id') is not None,
-            'is_thread': record.get('is_thread', False),
-            'language': record.get('lang', ''),
-            'source': record.get('source', ''),
-            'possibly_sensitive': record.get('possibly_sensitive', False),
-        }
-    
-    def _extract_entities(self, record):
-        """Extract entities like hashtags, mentions, URLs, media"""
-        entities = record.get('entities', {})
-        extended_entities = record.get('extended_entities', {})
-        
-        # Extract hashtags
-        hashtags = []
-        if 'hashtags' in entities:
-            hashtags = [f"#{tag['text'].lower()}" for tag in entities['hashtags']]
-        
-        # Also extract from text
-        tweet_text = self._extract_text(record)
-        if tweet_text:
-            text_hashtags = re.findall(r'#\w+', tweet_text.lower())
-            hashtags.extend(text_hashtags)
-        
-        hashtags = list(set(hashtags))  # Remove duplicates
-        
-        # Extract mentions
-        mentions = []
-        if 'user_mentions' in entities:
-            mentions = [f"@{mention['screen_name']}" for mention in entities['user_mentions']]
-        
-        # Extract URLs
-        urls = []
-        if 'urls' in entities:
-            urls = [url['expanded_url'] for url in entities['urls'] if url.get('expanded_url')]
-        
-        # Extract media
-        media = entities.get('media', []) + extended_entities.get('media', [])
-        media_types = [m.get('type', '') for m in media]
-        
-        return {
-            'hashtags': hashtags,
-            'mentions': mentions,
-            'urls': urls,
-            'hashtag_count': len(hashtags),
-            'mention_count': len(mentions),
-            'url_count': len(urls),
-            'has_media': len(media) > 0,
-            'media_count': len(media),
-            'media_types': media_types,
-        }
-    
-    def _parse_twitter_date(self, date_str):
-        """Parse Twitter date format to datetime"""
-        if not date_str:
-            return None
+            # Batches run in worker processes; only a couple per worker are in
+            # flight so a streamed file is still never fully held in memory
+            pending = deque()
+            submitted = 0
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                while True:
+                    while len(pending) < 2 * workers and (batch := next(batches, None)):
+                        pending.append((executor.submit(_process_batch, batch, submitted), len(batch)))
+                        submitted += len(batch)
+                    if not pending:
+                        break
+                    future, batch_len = pending.popleft()
+                    collect(future.result(), batch_len)
         
-        # Try different formats
-        formats = [
-            "%a %b %d %H:%M:%S %z %Y",  # Twitter format
-            "%Y-%m-%dT%H:%M:%S.%fZ",    # ISO format
-            "%Y-%m-%d %H:%M:%S",        # Simple format
-            "%Y-%m-%dT%H:%M:%SZ",       # ISO without microseconds
-        ]
+        # Raw records are not needed once flattened (and a stream is spent)
+        self.raw_data = None
         
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
+        self.processed_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
         
-        return None
-    
-    def _calculate_engagement_rate(self, engagement, followers):
-        """Calculate engagement rate"""
-        if followers == 0:
-            return 0
+        # Categorical codes cut memory and make the author group-bys hash ints
+        for column in _CATEGORY_COLUMNS:
+            if column in self.processed_df:
+                self.processed_df[column] = self.processed_df[column].astype('category')
+        
+        # Half-width counts halve the bytes the influencer aggregations stream through;
+        # a column keeps int64 if any value (e.g. a huge follower count) would overflow
+        for column in _COUNT_COLUMNS:
+            if column in self.processed_df and self.processed_df[column].abs().max() <= _INT32_MAX:
+                self.processed_df[column] = self.processed_df[column].astype('int32')
+        
+        print(f"✅ Successfully processed {len(self.processed_df)} records")
+        if skipped_records > 0:
+            print(f"⚠️ Skipped {skipped_records} records without tweet text or due to errors")
         
-        total_engagement = engagement.get('likes', 0) + engagement.get('retweets', 0) + engagement.get('replies', 0)
-        return (total_engagement / followers) * 100 if followers > 0 else 0
+        return True
     
     def filter_finance_bill_content(self):
         """Filter tweets related to Finance Bill"""
@@ -356,25 +451,22 @@ class XDataProcessor:
         
         print("🔍 Filtering Finance Bill related content...")
         
-        # Filter by hashtags
-        def has_finance_hashtags(hashtags):
-            if not hashtags:
-                return False
-            return any(hashtag in self.finance_bill_hashtags for hashtag in hashtags)
-        
-        # Filter by keywords in text
-        def has_finance_keywords(text):
-            if not text:
-                return False
-            text_lower = str(text).lower()
-            return any(keyword in text_lower for keyword in self.finance_keywords)
+        # Filter by hashtags: any of a tweet's hashtags in the Finance Bill set,
+        # with the set membership test done in C by frozenset.isdisjoint
+        finance_bill_hashtags = self.finance_bill_hashtags
+        hashtag_filter = self.processed_df['hashtags'].map(
+            lambda hashtags: not finance_bill_hashtags.isdisjoint(hashtags)
+        ).astype(bool)
         
-        # Apply filters
-        hashtag_filter = self.processed_df['hashtags'].apply(has_finance_hashtags)
-        keyword_filter = self.processed_df['text'].apply(has_finance_keywords)
+        # Filter by keywords in text, one alternation so each text is scanned once;
+        # tweets already matched by hashtag skip the regex scan
+        keyword_re = _keyword_pattern(tuple(self.finance_keywords))
+        unmatched_text = self.processed_df.loc[~hashtag_filter, 'text']
+        keyword_filter = unmatched_text.str.contains(keyword_re, na=False).astype(bool)
         
         # Combine filters
-        finance_filter = hashtag_filter | keyword_filter
+        finance_filter = hashtag_filter.copy()
+        finance_filter.loc[keyword_filter.index] = keyword_filter
         
         self.finance_bill_df = self.processed_df[finance_filter].copy()
         
@@ -390,35 +482,28 @@ class XDataProcessor:
         
         print("👥 Generating influencer metrics...")
         
-        # Group by author and calculate metrics
-        influencer_stats = self.finance_bill_df.groupby('author_username').agg({
-            'likes': ['sum', 'mean', 'max'],
-            'retweets': ['sum', 'mean', 'max'],
-            'replies': ['sum', 'mean', 'max'],
-            'quotes': ['sum', 'mean', 'max'],
-            'total_engagement': ['sum', 'mean', 'max'],
-            'tweet_id': 'count',
-            'author_followers': 'first',
-            'author_following': 'first',
-            'author_display_name': 'first',
-            'author_verified': 'first',
-            'author_created_at': 'first',
-            'location': 'first',
-            'created_timestamp': ['min', 'max'],
-        }).round(2)
-        
-        # Flatten column names
-        influencer_stats.columns = [
-            'total_likes', 'avg_likes', 'max_likes',
-            'total_retweets', 'avg_retweets', 'max_retweets',
-            'total_replies', 'avg_replies', 'max_replies',
-            'total_quotes', 'avg_quotes', 'max_quotes',
-            'total_engagement', 'avg_engagement', 'max_engagement',
-            'tweet_count',
-            'author_followers', 'author_following', 'author_display_name',
-            'author_verified', 'author_created_at', 'location',
-            'first_tweet', 'last_tweet'
-        ]
+        # Group by author and calculate metrics (re-sorted by engagement below)
+        influencer_stats = self.finance_bill_df.groupby('author_username', observed=True, sort=False).agg(
+            total_likes=('likes', 'sum'), avg_likes=('likes', 'mean'), max_likes=('likes', 'max'),
+            total_retweets=('retweets', 'sum'), avg_retweets=('retweets', 'mean'), max_retweets=('retweets', 'max'),
+            total_replies=('replies', 'sum'), avg_replies=('replies', 'mean'), max_replies=('replies', 'max'),
+            total_quotes=('quotes', 'sum'), avg_quotes=('quotes', 'mean'), max_quotes=('quotes', 'max'),
+            total_engagement=('total_engagement', 'sum'), avg_engagement=('total_engagement', 'mean'),
+            max_engagement=('total_engagement', 'max'),
+            tweet_count=('tweet_id', 'count'),
+            author_followers=('author_followers', 'first'),
+            author_following=('author_following', 'first'),
+            author_display_name=('author_display_name', 'first'),
+            author_verified=('author_verified', 'first'),
+            author_created_at=('author_created_at', 'first'),
+            location=('location', 'first'),
+            first_tweet=('created_timestamp', 'min'),
+            last_tweet=('created_timestamp', 'max'),
+        )
+        
+        # Only the means are fractional
+        float_cols = influencer_stats.select_dtypes('float').columns
+        influencer_stats[float_cols] = influencer_stats[float_cols].round(2)
         
         # Calculate additional metrics
         influencer_stats['engagement_rate'] = (
@@ -437,15 +522,12 @@ class XDataProcessor:
             influencer_stats['total_retweets'] / influencer_stats['tweet_count']
         ).round(2)
         
-        # Calculate activity span
-        influencer_stats['first_tweet'] = pd.to_datetime(influencer_stats['first_tweet'], errors='coerce')
-        influencer_stats['last_tweet'] = pd.to_datetime(influencer_stats['last_tweet'], errors='coerce')
+        # Calculate activity span (created_timestamp is parsed UTC datetime64, and
+        # the group min/max keep that dtype, so no re-parse is needed)
         influencer_stats.dropna(subset=['first_tweet', 'last_tweet'], inplace=True)
-
         influencer_stats['activity_span_days'] = (
-    influencer_stats['last_tweet'] - influencer_stats['first_tweet']
-).dt.days
-
+            influencer_stats['last_tweet'] - influencer_stats['first_tweet']
+        ).dt.days
         
         # Sort by total engagement
         influencer_stats = influencer_stats.sort_values('total_engagement', ascending=False)
@@ -462,31 +544,30 @@ class XDataProcessor:
         
         return True
     
-    def save_processed_data(self):
-        """Save all processed data to CSV files"""
+    def save_processed_data(self, csv_compat=False):
+        """
+        Save all processed data to Parquet files
+        
+        Args:
+            csv_compat (bool): Also write CSV copies of each file
+        """
         if self.processed_df is None:
             print("❌ No processed data to save.")
             return False
         
-        print("💾 Saving processed data to CSV files...")
+        print("💾 Saving processed data to Parquet files...")
         
         try:
             # Save main processed data
-            processed_path = 'data/processed_data/x_processed.csv'
-            self.processed_df.to_csv(processed_path, index=False)
-            print(f"✅ Saved x_processed.csv ({len(self.processed_df)} records)")
+            self._save_frame(self.processed_df, 'x_processed', csv_compat)
             
             # Save Finance Bill data
             if self.finance_bill_df is not None:
-                finance_path = 'data/processed_data/x_finance_bill.csv'
-                self.finance_bill_df.to_csv(finance_path, index=False)
-                print(f"✅ Saved x_finance_bill.csv ({len(self.finance_bill_df)} records)")
+                self._save_frame(self.finance_bill_df, 'x_finance_bill', csv_compat)
             
             # Save influencer data
             if self.influencers_df is not None:
-                influencer_path = 'data/processed_data/finance_bill_influencers.csv'
-                self.influencers_df.to_csv(influencer_path, index=False)
-                print(f"✅ Saved finance_bill_influencers.csv ({len(self.influencers_df)} records)")
+                self._save_frame(self.influencers_df, 'finance_bill_influencers', csv_compat)
             
             return True
             
@@ -494,6 +575,25 @@ class XDataProcessor:
             print(f"❌ Error saving data: {e}")
             return False
     
+    def _save_frame(self, df, name, csv_compat):
+        """Write one frame to data/processed_data; list columns stay native in Parquet"""
+        df.to_parquet(f'data/processed_data/{name}.parquet', index=False, compression='zstd')
+        print(f"✅ Saved {name}.parquet ({len(df)} records)")
+        
+        if csv_compat:
+            # Arrow's threaded C++ writer. List columns are written as their Python
+            # repr and timestamps in pandas' text form, as to_csv did, so older
+            # readers can still literal_eval / parse them
+            csv_df = df.copy()
+            for column in df.columns:
+                if isinstance(df[column].dtype, pd.DatetimeTZDtype):
+                    csv_df[column] = df[column].astype(str).where(df[column].notna())
+                elif df[column].dtype == object and df[column].map(type).eq(list).any():
+                    csv_df[column] = df[column].map(str)
+            table = pa.Table.from_pandas(csv_df, preserve_index=False)
+            pa_csv.write_csv(table, f'data/processed_data/{name}.csv')
+            print(f"✅ Saved {name}.csv ({len(df)} records)")
+    
     def generate_summary_report(self):
         """Generate a summary report of the processed data"""
         if self.processed_df is None:
@@ -544,27 +644,24 @@ class XDataProcessor:
         # Hashtag analysis
         if self.finance_bill_df is not None:
             print(f"\n🔥 Most Common Finance Bill Hashtags:")
-            all_hashtags = []
-            for hashtag_list in self.finance_bill_df['hashtags'].dropna():
-                if isinstance(hashtag_list, str):
-                    try:
-                        hashtag_list = eval(hashtag_list)
-                    except:
-                        continue
-                all_hashtags.extend(hashtag_list)
-            
-            hashtag_counts = Counter(all_hashtags)
-            for hashtag, count in hashtag_counts.most_common(10):
+            # hashtags is a list column in memory; value_counts returns it sorted
+            hashtag_counts = self.finance_bill_df['hashtags'].explode().value_counts().head(10)
+            for hashtag, count in hashtag_counts.items():
                 print(f"   {hashtag}: {count:,} tweets")
         
         print("\n✅ Data processing complete!")
         print("📁 Files saved in: data/processed_data/")
-        print("   - x_processed.csv (all processed tweets)")
-        print("   - x_finance_bill.csv (Finance Bill related tweets)")
-        print("   - finance_bill_influencers.csv (influencer metrics)")
+        print("   - x_processed.parquet (all processed tweets)")
+        print("   - x_finance_bill.parquet (Finance Bill related tweets)")
+        print("   - finance_bill_influencers.parquet (influencer metrics)")
     
-    def process_all(self):
-        """Run the complete processing pipeline"""
+    def process_all(self, csv_compat=False):
+        """
+        Run the complete processing pipeline
+        
+        Args:
+            csv_compat (bool): Also write CSV copies of the output files
+        """
         print("🚀 Starting complete X/Twitter data processing pipeline...")
         
         # Step 1: Load data
@@ -584,7 +681,7 @@ class XDataProcessor:
             return False
         
         # Step 5: Save processed data
-        if not self.save_processed_data():
+        if not self.save_processed_data(csv_compat):
             return False
         
         # Step 6: Generate summary report
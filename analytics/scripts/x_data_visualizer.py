@@ -8,36 +8,184 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
+from plotly.offline import get_plotlyjs
 import networkx as nx
 from wordcloud import WordCloud
 import numpy as np
 from datetime import datetime, timedelta
+from functools import cached_property
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+import re
 import warnings
 warnings.filterwarnings('ignore')
 
+_HASHTAG_RE = re.compile(r'#\w+')
+_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+
+def _similar_pairs(engagement, block_rows=1024):
+    """
+    Index pairs (i < j) whose engagement differs by under half of engagement[i],
+    in row-major order
+    
+    Args:
+        engagement (np.ndarray): Engagement per influencer
+        block_rows (int): Rows compared per step, bounding memory to block_rows x N
+    """
+    eng = np.asarray(engagement, dtype=np.float64)
+    columns = np.arange(len(eng))
+    rows, cols = [], []
+    for start in range(0, len(eng), block_rows):
+        block = eng[start:start + block_rows, None]
+        similar = np.abs(block - eng[None, :]) < block * 0.5  # Within 50%
+        similar &= columns[None, :] > columns[start:start + block_rows, None]
+        block_i, block_j = np.nonzero(similar)
+        rows.append(block_i + start)
+        cols.append(block_j)
+    if not rows:
+        return columns, columns
+    return np.concatenate(rows), np.concatenate(cols)
+
+def _write_html(fig, path):
+    """Write one Plotly figure to HTML (module-level so worker processes can pickle it)"""
+    fig.write_html(path, include_plotlyjs='directory')
+
 class XDataVisualizer:
-    def __init__(self, processed_csv_path, finance_bill_csv_path, influencers_csv_path):
+    # Only the columns the visualizations read are loaded from each file
+    _TWEET_COLUMNS = ['text', 'author_username', 'author_followers', 'author_verified', 'location',
+                      'likes', 'retweets', 'replies', 'created_timestamp', 'is_retweet']
+    _INFLUENCER_COLUMNS = ['author_username', 'author_followers', 'author_verified',
+                           'total_engagement', 'tweet_count']
+    
+    # Hashtags tracked in the evolution plot
+    KEY_HASHTAGS = ['#rejectfinancebill2024', '#rutomustgo', '#occupyparliament', '#genzkenya']
+    
+    def __init__(self, processed_path, finance_bill_path, influencers_path):
         """
         Initialize visualizer with processed data files
         
         Args:
-            processed_csv_path: Path to x_processed.csv
-            finance_bill_csv_path: Path to x_finance_bill.csv  
-            influencers_csv_path: Path to finance_bill_influencers.csv
+            processed_path: Path to x_processed.parquet
+            finance_bill_path: Path to x_finance_bill.parquet
+            influencers_path: Path to finance_bill_influencers.parquet
         """
-        self.processed_df = pd.read_csv(processed_csv_path)
-        self.finance_df = pd.read_csv(finance_bill_csv_path)
-        self.influencers_df = pd.read_csv(influencers_csv_path)
-        
-        # Convert datetime columns
-        self.processed_df['created_timestamp'] = pd.to_datetime(self.processed_df['created_timestamp'])
-        self.finance_df['created_timestamp'] = pd.to_datetime(self.finance_df['created_timestamp'])
+        self.processed_df = pd.read_parquet(processed_path, columns=self._TWEET_COLUMNS)
+        self.finance_df = pd.read_parquet(finance_bill_path, columns=self._TWEET_COLUMNS)
+        self.influencers_df = pd.read_parquet(influencers_path, columns=self._INFLUENCER_COLUMNS)
+        
+        # Group keys as categoricals (int codes to hash) and text as Arrow-backed
+        # strings, for files or pandas versions that load them as object
+        for df in (self.processed_df, self.finance_df, self.influencers_df):
+            for column in ('author_username', 'location'):
+                if column in df and not isinstance(df[column].dtype, pd.CategoricalDtype):
+                    df[column] = df[column].astype('category')
+            if 'text' in df and df['text'].dtype == object:
+                df['text'] = df['text'].astype('string[pyarrow]')
+            
+            # Counts coerced to numbers once here rather than in every plot
+            for column in ('likes', 'retweets', 'replies', 'author_followers'):
+                if column in df and not pd.api.types.is_numeric_dtype(df[column]):
+                    df[column] = pd.to_numeric(df[column], errors='coerce')
+        
+        # Empty strings came back as missing values from the old CSV exports;
+        # keep that, and drop categories unused in each (filtered) file
+        for df in (self.processed_df, self.finance_df, self.influencers_df):
+            for column in df.select_dtypes('category'):
+                values = df[column].cat.remove_unused_categories()
+                if '' in values.cat.categories:
+                    values = values.cat.remove_categories('')
+                df[column] = values
+        
+        # created_timestamp is stored as a UTC datetime64, so needs no parsing
         
         # Set style for better visualizations
         plt.style.use('seaborn-v0_8')
         sns.set_palette("husl")
-        
+    
+    # Aggregates shared by several plots and the summary, each built once on
+    # first access; daily ones are keyed by UTC day (datetime64)
+    @cached_property
+    def _by_day(self):
+        return self.finance_df.groupby(self.finance_df['created_timestamp'].dt.floor('D'))
+    
+    @cached_property
+    def daily_counts(self):
+        """Finance Bill tweets per day"""
+        return self._by_day.size()
+    
+    @cached_property
+    def hourly_counts(self):
+        """Finance Bill tweets per hour of day"""
+        return self.finance_df.groupby(self.finance_df['created_timestamp'].dt.hour).size()
+    
+    @cached_property
+    def daily_engagement_cumsum(self):
+        """Running likes/retweets/replies totals per day"""
+        # One cumsum sweep over the stacked (days x 3) sums, accumulated in int64
+        daily_sums = self._by_day[['likes', 'retweets', 'replies']].sum()
+        return pd.DataFrame(np.cumsum(daily_sums.to_numpy(), axis=0),
+                            index=daily_sums.index, columns=daily_sums.columns)
+    
+    @cached_property
+    def daily_tweet_types(self):
+        """Original tweets (False) and retweets (True) per day"""
+        return (self._by_day['is_retweet'].value_counts().unstack(fill_value=0)
+                .reindex(columns=[False, True], fill_value=0))
+    
+    @cached_property
+    def tweet_type_perf(self):
+        """Mean likes/retweets/replies for original tweets vs retweets"""
+        return self.finance_df.groupby('is_retweet')[['likes', 'retweets', 'replies']].mean()
+    
+    @cached_property
+    def verified_perf(self):
+        """Mean likes/retweets for unverified vs verified authors"""
+        return self.finance_df.groupby('author_verified')[['likes', 'retweets']].mean()
+    
+    @cached_property
+    def _lower_text(self):
+        # Tweet text lowercased once; hashtags and words are both scanned from it
+        return self.finance_df['text'].fillna('').astype(str).str.lower()
+    
+    @cached_property
+    def _hashtag_lists(self):
+        return self._lower_text.str.findall(_HASHTAG_RE)
+    
+    @cached_property
+    def _word_lists(self):
+        return self._lower_text.str.findall(_WORD_RE)
+    
+    @cached_property
+    def _wordcloud_axes(self):
+        # One figure reused by every word cloud call
+        return plt.subplots(figsize=(15, 8))
+    
+    @cached_property
+    def daily_hashtag_counts(self):
+        """Tweets per (hashtag, date) for KEY_HASHTAGS found in the tweet text"""
+        hashtags = self._hashtag_lists
+        days = self.finance_df['created_timestamp'].dt.tz_localize(None).to_numpy().astype('datetime64[D]')
+        
+        # One (hashtag code, day) pair per hashtag use, key hashtags only
+        codes = pd.Categorical(list(chain.from_iterable(hashtags)), categories=self.KEY_HASHTAGS).codes
+        pair_days = np.repeat(days, hashtags.str.len().to_numpy())
+        keep = (codes >= 0) & ~np.isnat(pair_days)
+        codes, pair_days = codes[keep], pair_days[keep]
+        
+        # Sort the pairs, then count each run of equal pairs with one reduceat
+        order = np.lexsort((pair_days, codes))
+        codes, pair_days = codes[order], pair_days[order]
+        starts = np.flatnonzero(np.r_[len(codes) > 0, (codes[1:] != codes[:-1]) | (pair_days[1:] != pair_days[:-1])])
+        counts = np.add.reduceat(np.ones(len(codes), dtype=np.int64), starts) if len(codes) else np.zeros(0, dtype=np.int64)
+        
+        index = pd.MultiIndex.from_arrays(
+            [np.asarray(self.KEY_HASHTAGS, dtype=object)[codes[starts]], pair_days[starts].astype(object)],
+            names=['hashtag', 'date']
+        )
+        return pd.Series(counts, index=index)
+    
     def create_timeline_visualization(self):
         """Create comprehensive timeline visualizations"""
         fig = make_subplots(
@@ -54,16 +202,19 @@ class XDataVisualizer:
                    [{"secondary_y": False}]]
         )
         
+        # One day-level group-by feeds the volume, engagement and tweet-type traces
+        daily_tweets = self.daily_counts
+        days = daily_tweets.index.date
+        
         # Daily volume
-        daily_tweets = self.finance_df.groupby(self.finance_df['created_timestamp'].dt.date).size()
         fig.add_trace(
-            go.Scatter(x=daily_tweets.index, y=daily_tweets.values, 
+            go.Scatter(x=days, y=daily_tweets.values, 
                       name='Daily Tweets', line=dict(color='#1f77b4', width=3)),
             row=1, col=1
         )
         
         # Hourly patterns
-        hourly_tweets = self.finance_df.groupby(self.finance_df['created_timestamp'].dt.hour).size()
+        hourly_tweets = self.hourly_counts
         fig.add_trace(
             go.Bar(x=hourly_tweets.index, y=hourly_tweets.values,
                    name='Hourly Activity', marker_color='#ff7f0e'),
@@ -71,47 +222,32 @@ class XDataVisualizer:
         )
         
         # Cumulative engagement
-        daily_engagement = self.finance_df.groupby(self.finance_df['created_timestamp'].dt.date).agg({
-            'likes': 'sum',
-            'retweets': 'sum',
-            'replies': 'sum'
-        }).cumsum()
+        daily_engagement = self.daily_engagement_cumsum
         
         fig.add_trace(
-            go.Scatter(x=daily_engagement.index, y=daily_engagement['likes'],
+            go.Scatter(x=days, y=daily_engagement['likes'],
                       name='Cumulative Likes', line=dict(color='#d62728')),
             row=3, col=1
         )
         fig.add_trace(
-            go.Scatter(x=daily_engagement.index, y=daily_engagement['retweets'],
+            go.Scatter(x=days, y=daily_engagement['retweets'],
                       name='Cumulative Retweets', line=dict(color='#2ca02c')),
             row=3, col=1
         )
         
         # Tweet types over time
-        daily_types = self.finance_df.groupby([
-            self.finance_df['created_timestamp'].dt.date,
-            self.finance_df['is_retweet']
-        ]).size().unstack(fill_value=0)
+        daily_types = self.daily_tweet_types
         
         fig.add_trace(
-    go.Scatter(
-        x=daily_types.index,
-        y=daily_types.get(False, pd.Series([0] * len(daily_types.index))),
-        name='Original Tweets', stackgroup='one', fill='tonexty'
-    ),
-    row=4, col=1
-)
-
+            go.Scatter(x=days, y=daily_types[False],
+                      name='Original Tweets', stackgroup='one', fill='tonexty'),
+            row=4, col=1
+        )
         fig.add_trace(
-         go.Scatter(
-          x=daily_types.index,
-          y=daily_types.get(True, pd.Series([0] * len(daily_types.index))),
-          name='Retweets', stackgroup='one', fill='tonexty'
-          ),
-    row=4, col=1
-)
-
+            go.Scatter(x=days, y=daily_types[True],
+                      name='Retweets', stackgroup='one', fill='tonexty'),
+            row=4, col=1
+        )
         
         fig.update_layout(
             height=1200,
@@ -121,34 +257,37 @@ class XDataVisualizer:
         
         return fig
     
-    def create_influencer_network(self):
-        """Create network visualization of top influencers"""
-        # Get top 30 influencers for network analysis
-        top_influencers = self.influencers_df.head(30)
+    def create_influencer_network(self, n=30):
+        """
+        Create network visualization of top influencers
+        
+        Args:
+            n (int): Number of top influencers in the network
+        """
+        # Get top influencers for network analysis
+        top_influencers = self.influencers_df.head(n)
         
         # Create network graph
         G = nx.Graph()
         
         # Add nodes (influencers)
-        for _, influencer in top_influencers.iterrows():
-            G.add_node(
-                influencer['author_username'],
-                followers=influencer['author_followers'],
-                engagement=influencer['total_engagement'],
-                tweets=influencer['tweet_count'],
-                verified=influencer['author_verified']
+        users = top_influencers['author_username'].to_numpy()
+        engagement = top_influencers['total_engagement'].to_numpy()
+        G.add_nodes_from(
+            (user, {'followers': followers, 'engagement': eng, 'tweets': tweets, 'verified': verified})
+            for user, followers, eng, tweets, verified in zip(
+                users, top_influencers['author_followers'], engagement,
+                top_influencers['tweet_count'], top_influencers['author_verified']
             )
+        )
         
-        # Add edges based on engagement similarity (simplified)
-        for i, inf1 in top_influencers.iterrows():
-            for j, inf2 in top_influencers.iterrows():
-                if i < j:  # Avoid duplicate edges
-                    # Create edge if engagement levels are similar
-                    eng_diff = abs(inf1['total_engagement'] - inf2['total_engagement'])
-                    if eng_diff < inf1['total_engagement'] * 0.5:  # Within 50%
-                        G.add_edge(inf1['author_username'], inf2['author_username'])
+        # Add edges based on engagement similarity (simplified): broadcast
+        # comparisons a block of rows at a time, upper triangle only
+        rows, cols = _similar_pairs(engagement)
+        G.add_edges_from(zip(users[rows], users[cols]))
         
-        # Create layout
+        # Create layout (NumPy Fruchterman-Reingold; networkx switches to its
+        # sparse SciPy variant by itself from 500 nodes)
         pos = nx.spring_layout(G, k=3, iterations=50)
         
         # Extract node information
@@ -235,33 +374,40 @@ class XDataVisualizer:
         )
         
         # Top engaging tweets
-        self.finance_df['likes'] = pd.to_numeric(self.finance_df['likes'], errors='coerce')
-        self.finance_df['retweets'] = pd.to_numeric(self.finance_df['retweets'], errors='coerce')
-        self.finance_df['replies'] = pd.to_numeric(self.finance_df['replies'], errors='coerce') 
-        top_tweets = self.finance_df.nlargest(20, 'likes')
+        likes = self.finance_df['likes'].to_numpy()
+        retweets = self.finance_df['retweets'].to_numpy()
+        followers = self.finance_df['author_followers'].to_numpy()
+        
+        # Top 20 by likes via an O(N) partition; ties at the cut-off resolve to
+        # the earliest tweets, as nlargest does
+        if len(likes) > 20:
+            cutoff = np.partition(likes, len(likes) - 20)[len(likes) - 20]
+            candidates = np.flatnonzero(likes >= cutoff)
+        else:
+            candidates = np.arange(len(likes))
+        top_rows = candidates[np.argsort(-likes[candidates].astype(np.float64), kind='stable')[:20]]
+        top_tweets = self.finance_df.iloc[top_rows]
         fig.add_trace(
-            go.Bar(x=top_tweets['likes'], y=range(len(top_tweets)),
+            go.Bar(x=top_tweets['likes'], y=np.arange(len(top_tweets)),
                    orientation='h', name='Likes',
                    text=top_tweets['author_username'],
                    textposition='inside'),
             row=1, col=1
         )
         
-        # Engagement rate vs followers
-        engagement_rate = (self.finance_df['likes'] + self.finance_df['retweets']) / self.finance_df['author_followers'] * 100
+        # Engagement rate vs followers, computed in place in one float buffer
+        engagement_rate = np.add(likes, retweets, dtype=np.float64)
+        np.divide(engagement_rate, followers, out=engagement_rate)
+        np.multiply(engagement_rate, 100, out=engagement_rate)
         fig.add_trace(
-            go.Scatter(x=self.finance_df['author_followers'], y=engagement_rate,
+            go.Scatter(x=followers, y=engagement_rate,
                       mode='markers', name='Engagement Rate',
                       marker=dict(size=8, opacity=0.6)),
             row=1, col=2
         )
         
         # Tweet type performance
-        tweet_performance = self.finance_df.groupby('is_retweet').agg({
-            'likes': 'mean',
-            'retweets': 'mean',
-            'replies': 'mean'
-        })
+        tweet_performance = self.tweet_type_perf
         
         categories = ['Original', 'Retweet']
         fig.add_trace(
@@ -276,10 +422,7 @@ class XDataVisualizer:
         )
         
         # Verification impact
-        verified_performance = self.finance_df.groupby('author_verified').agg({
-            'likes': 'mean',
-            'retweets': 'mean'
-        })
+        verified_performance = self.verified_perf
         
         verification_labels = ['Unverified', 'Verified']
         fig.add_trace(
@@ -298,37 +441,17 @@ class XDataVisualizer:
     
     def create_hashtag_evolution(self):
         """Visualize hashtag evolution over time"""
-        # Extract hashtags from text
-        import re
-        
-        def extract_hashtags(text):
-            if pd.isna(text):
-                return []
-            return re.findall(r'#\w+', str(text).lower())
-        
-        self.finance_df['hashtags'] = self.finance_df['text'].apply(extract_hashtags)
-        
-        # Create daily hashtag counts
-        daily_hashtags = {}
-        for _, row in self.finance_df.iterrows():
-            date = row['created_timestamp'].date()
-            for hashtag in row['hashtags']:
-                if hashtag not in daily_hashtags:
-                    daily_hashtags[hashtag] = {}
-                daily_hashtags[hashtag][date] = daily_hashtags[hashtag].get(date, 0) + 1
-        
-        # Focus on key hashtags
-        key_hashtags = ['#rejectfinancebill2024', '#rutomustgo', '#occupyparliament', '#genzkenya']
+        daily_hashtags = self.daily_hashtag_counts
         
         fig = go.Figure()
         
-        for hashtag in key_hashtags:
-            if hashtag in daily_hashtags:
-                dates = sorted(daily_hashtags[hashtag].keys())
-                counts = [daily_hashtags[hashtag][date] for date in dates]
+        # Focus on key hashtags
+        for hashtag in self.KEY_HASHTAGS:
+            if hashtag in daily_hashtags.index.get_level_values('hashtag'):
+                counts = daily_hashtags.loc[hashtag]
                 
                 fig.add_trace(go.Scatter(
-                    x=dates, y=counts,
+                    x=list(counts.index), y=counts.tolist(),
                     mode='lines+markers',
                     name=hashtag,
                     line=dict(width=3)
@@ -347,25 +470,27 @@ class XDataVisualizer:
     
     def create_wordcloud_analysis(self):
         """Create word clouds for different periods"""
-        # Combine all Finance Bill tweet text
-        all_text = ' '.join(self.finance_df['text'].dropna().astype(str))
-        
         # Remove common words and URLs
         from wordcloud import STOPWORDS
         stopwords = set(STOPWORDS)
         stopwords.update(['https', 'http', 'co', 't', 'amp', 'rt', 'via', 'twitter', 'com'])
         
+        # Count words column-wise rather than joining all tweets into one string
+        # for WordCloud to re-tokenize
+        words = self._word_lists.explode()
+        word_counts = words[~words.isin(stopwords)].value_counts()
+        
         # Create word cloud
         wordcloud = WordCloud(
             width=1200, height=600,
             background_color='white',
-            stopwords=stopwords,
             max_words=100,
             colormap='viridis'
-        ).generate(all_text)
+        ).generate_from_frequencies(word_counts.head(100).to_dict())
         
-        # Create matplotlib figure
-        fig, ax = plt.subplots(figsize=(15, 8))
+        # Draw on the cached matplotlib figure, cleared first
+        fig, ax = self._wordcloud_axes
+        ax.clear()
         ax.imshow(wordcloud, interpolation='bilinear')
         ax.axis('off')
         ax.set_title('💬 Word Cloud: Most Common Terms in Finance Bill Tweets', 
@@ -465,60 +590,109 @@ class XDataVisualizer:
         
         return fig
     
-    def generate_comprehensive_report(self):
-        """Generate all visualizations and save them"""
+    def generate_comprehensive_report(self, static_images=False):
+        """
+        Generate all visualizations and save them
+        
+        Args:
+            static_images (bool): Also export PNGs of the Plotly figures (needs kaleido)
+        """
         print("📊 Generating comprehensive visualization report...")
         
         # Create output directory
         import os
         os.makedirs('visualizations', exist_ok=True)
         
-        # Generate all visualizations
+        # Generate all visualizations; the word cloud is filled in below, once
+        # the Plotly figures are already serializing
         visualizations = {
             'timeline': self.create_timeline_visualization(),
             'network': self.create_influencer_network(),
             'engagement': self.create_engagement_analysis(),
             'hashtags': self.create_hashtag_evolution(),
-            'wordcloud': self.create_wordcloud_analysis(),
+            'wordcloud': None,
             'influencers': self.create_influencer_ranking(),
             'geographic': self.create_geographic_analysis()
         }
         
-        # Save interactive plots
-        for name, fig in visualizations.items():
-            if hasattr(fig, 'write_html'):  # Plotly figures
-                fig.write_html(f'visualizations/{name}_analysis.html')
-                print(f"✅ Saved {name}_analysis.html")
-            else:  # Matplotlib figures
-                fig.savefig(f'visualizations/{name}_analysis.png', dpi=300, bbox_inches='tight')
-                print(f"✅ Saved {name}_analysis.png")
+        # Save interactive plots; the HTMLs share one plotly.min.js in the folder
+        # instead of each embedding its own multi-MB copy. It is written here
+        # once so the workers below never race to create it
+        bundle_path = 'visualizations/plotly.min.js'
+        if not os.path.exists(bundle_path):
+            with open(bundle_path, 'w', encoding='utf-8') as f:
+                f.write(get_plotlyjs())
+        
+        # Plotly figures serialize in worker processes while the word cloud is
+        # laid out and rendered here; results are reported in the original order
+        with ProcessPoolExecutor() as executor:
+            pending = {
+                name: executor.submit(_write_html, fig, f'visualizations/{name}_analysis.html')
+                for name, fig in visualizations.items() if hasattr(fig, 'write_html')
+            }
+            visualizations['wordcloud'] = self.create_wordcloud_analysis()
+            for name, fig in visualizations.items():
+                if name in pending:  # Plotly figures
+                    pending[name].result()
+                    print(f"✅ Saved {name}_analysis.html")
+                else:  # Matplotlib figures
+                    fig.savefig(f'visualizations/{name}_analysis.png', dpi=300, bbox_inches='tight')
+                    print(f"✅ Saved {name}_analysis.png")
+        
+        if static_images:
+            self._export_static_images(visualizations)
         
         # Generate summary statistics
         self.generate_summary_stats()
         
         print("\n🎉 Comprehensive visualization report generated!")
-        print("📁 Check the 'visualizations' folder for all files")
+        print("📁 Check the 'visualizations' folder for all files (keep plotly.min.js with the HTMLs)")
         
         return visualizations
     
+    def _export_static_images(self, visualizations):
+        """Write a PNG of every Plotly figure in one Kaleido session"""
+        figures = {name: fig for name, fig in visualizations.items() if hasattr(fig, 'write_image')}
+        paths = [f'visualizations/{name}_analysis.png' for name in figures]
+        
+        # write_images (plotly 6.1+) reuses one browser for the whole batch;
+        # older plotly starts Kaleido per figure
+        if hasattr(pio, 'write_images'):
+            pio.write_images(list(figures.values()), paths, scale=2)
+        else:
+            for fig, path in zip(figures.values(), paths):
+                fig.write_image(path, scale=2)
+        
+        for name in figures:
+            print(f"✅ Saved {name}_analysis.png")
+    
     def generate_summary_stats(self):
         """Generate key statistics for the report"""
+        # Reuse the daily aggregates the plots built; the running totals cover
+        # every tweet unless some have no timestamp
+        daily_counts = self.daily_counts
+        if daily_counts.sum() == len(self.finance_df):
+            total_engagement = int(self.daily_engagement_cumsum.iloc[-1].sum())
+        else:
+            total_engagement = int(self.finance_df[['likes', 'retweets', 'replies']].sum().sum())
+        
         stats = {
             'total_tweets': len(self.finance_df),
-            'total_engagement': self.finance_df[['likes', 'retweets', 'replies']].sum().sum(),
+            'total_engagement': total_engagement,
             'top_influencer': self.influencers_df.iloc[0]['author_username'],
-            'peak_day': self.finance_df.groupby(self.finance_df['created_timestamp'].dt.date).size().idxmax(),
+            'peak_day': daily_counts.idxmax().date(),
             'total_influencers': len(self.influencers_df),
             'avg_engagement_per_tweet': self.finance_df['likes'].mean(),
-            'date_range': f"{self.finance_df['created_timestamp'].min().date()} to {self.finance_df['created_timestamp'].max().date()}"
+            'date_range': f"{daily_counts.index.min().date()} to {daily_counts.index.max().date()}"
         }
         
-        # Save to file
+        # Save to file (thousands separators for the numbers only)
         with open('visualizations/summary_stats.txt', 'w') as f:
             f.write("🐦 X/TWITTER FINANCE BILL ANALYSIS - KEY STATISTICS\n")
             f.write("="*60 + "\n\n")
             for key, value in stats.items():
-                f.write(f"{key.replace('_', ' ').title()}: {value:,}\n")
+                value = f"{value:,}" if isinstance(value, (int, float, np.number)) else value
+                f.write(f"{key.replace('_', ' ').title()}: {value}\n")
         
         print("✅ Summary statistics saved to visualizations/summary_stats.txt")
         return stats
@@ -527,9 +701,9 @@ class XDataVisualizer:
 if __name__ == "__main__":
     # Initialize visualizer with your processed data
     visualizer = XDataVisualizer(
-        processed_csv_path="data/processed_data/x_processed.csv",
-        finance_bill_csv_path="data/processed_data/x_finance_bill.csv",
-        influencers_csv_path="data/processed_data/finance_bill_influencers.csv"
+        processed_path="data/processed_data/x_processed.parquet",
+        finance_bill_path="data/processed_data/x_finance_bill.parquet",
+        influencers_path="data/processed_data/finance_bill_influencers.parquet"
     )
     
     # Generate comprehensive report
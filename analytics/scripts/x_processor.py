@@ -4,13 +4,186 @@ Process X/Twitter JSON data for analysis
 """
 
 import pandas as pd
+import orjson
 import json
 import re
-from datetime import datetime
+import os
+from itertools import islice, chain
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib.pyplot as plt
 import seaborn as sns
-from collections import Counter
 import numpy as np
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+_HASHTAG_RE = re.compile(r'#\w+')
+
+# Text phrases that mark a tweet as Finance Bill content
+_FINANCE_KEYWORDS = ('finance bill', 'ruto must go', 'occupy parliament', 'gen z', 'kenya protest')
+_FINANCE_KEYWORD_RE = re.compile('|'.join(map(re.escape, _FINANCE_KEYWORDS)))
+
+# Processed tweet columns, in the order process_data builds each row
+_PROCESSED_COLUMNS = [
+    # Tweet metadata
+    'tweet_id', 'tweet_url', 'text',
+    # Author info
+    'author_username', 'author_display_name', 'author_followers', 'author_verified', 'author_id',
+    # Engagement metrics
+    'likes', 'retweets', 'replies', 'quotes',
+    # Timing (created_timestamp is parsed for the whole column afterwards)
+    'created_at',
+    # Tweet type
+    'is_retweet', 'is_quote', 'is_reply',
+    # Location
+    'location', 'geo_coordinates',
+    # Media and entities
+    'has_media', 'media_count', 'hashtag_count', 'mention_count', 'url_count',
+    # Language and source
+    'language', 'source',
+]
+
+# Twitter's created_at format; anything else is parsed as ISO 8601
+_TWITTER_DATE_FORMAT = '%a %b %d %H:%M:%S %z %Y'
+
+# Repetitive text columns stored as categoricals
+_CATEGORY_COLUMNS = ('author_username', 'author_display_name', 'location', 'language', 'source')
+
+# Engagement counts narrowed to int32 when every value fits
+_COUNT_COLUMNS = ('likes', 'retweets', 'replies', 'quotes')
+_INT32_MAX = np.iinfo(np.int32).max
+
+# Influencer table fields taken from each author's first tweet
+_AUTHOR_ATTRIBUTES = ('author_followers', 'author_display_name', 'author_verified')
+
+# User object fields read for each tweet's author
+_USER_FIELDS = ('screen_name', 'name', 'followers_count', 'verified', 'id_str', 'location')
+
+def _loads(data):
+    """Parse JSON bytes with orjson, falling back to the stdlib parser for
+    input orjson rejects (NaN/Infinity literals, unpaired surrogates)"""
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+def _to_parquet(df, path, chunksize=50_000):
+    """
+    Write df as zstd Parquet, converting and writing one row group of chunksize
+    rows at a time so only that slice is ever held as an Arrow copy. Arrow needs
+    one type per column, so object columns where '' defaults (or string ids)
+    sit next to numbers, bools or lists are stored as their text form, as they
+    were in the CSV export
+    """
+    df = df.copy(deep=False)
+    for column in df.columns[df.dtypes == object]:
+        types = set(df[column].dropna().map(type))
+        if str in types and len(types) > 1:
+            df[column] = df[column].astype(str)
+    
+    # Types come from the whole frame, so a chunk of all-empty lists still
+    # gets the list<string> column the other chunks have
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(path, schema, compression='zstd') as writer:
+        for start in range(0, len(df), chunksize):
+            chunk = df.iloc[start:start + chunksize]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+def _get_user_fields(record):
+    """Extract the author fields (_USER_FIELDS order) from various possible locations"""
+    # Direct user object
+    user = record.get('user')
+    if isinstance(user, dict):
+        get = user.get
+        return (get('screen_name', ''), get('name', ''), get('followers_count', ''),
+                get('verified', ''), get('id_str', ''), get('location', ''))
+    
+    # Direct field (some APIs flatten user data), else the author object
+    author = record.get('author')
+    if not isinstance(author, dict):
+        author = {}
+    return tuple(record[field] if field in record else author.get(field, '') for field in _USER_FIELDS)
+
+def _process_batch(batch):
+    """
+    Turn a batch of raw tweet dicts into row tuples in _PROCESSED_COLUMNS order
+    (module-level so worker processes can pickle it); the frame is built from
+    positional rows instead of hashing every key of a dict per tweet
+    
+    Args:
+        batch (list): Raw tweet dicts
+    """
+    rows = []
+    
+    for record in batch:
+        try:
+            # Resolve the user container once for all author fields; each
+            # tweet's own user snapshot is read (follower counts drift)
+            username, display_name, followers, verified, author_id, location = _get_user_fields(record)
+            
+            # The URL is built from the raw id: the tweet_id column turns to
+            # float (losing digits) when some ids are missing
+            tweet_id = record.get('id', record.get('id_str', ''))
+            
+            # Fetch each entities container once; media can be in either
+            entities = record.get('entities') or {}
+            extended_entities = record.get('extended_entities') or {}
+            media_count = len(entities.get('media') or ()) + len(extended_entities.get('media') or ())
+            
+            # Handle different tweet structures
+            row = (
+                # Tweet metadata
+                tweet_id,
+                f"https://twitter.com/i/web/status/{tweet_id}",
+                record.get('text', record.get('full_text', '')),
+                
+                # Author info - handle nested user object
+                username,
+                display_name,
+                followers,
+                verified,
+                author_id,
+                
+                # Engagement metrics
+                record.get('favorite_count', record.get('favourites_count', 0)),
+                record.get('retweet_count', 0),
+                record.get('reply_count', 0),
+                record.get('quote_count', 0),
+                
+                # Timing
+                record.get('created_at', ''),
+                
+                # Tweet type
+                record.get('retweeted_status') is not None,
+                record.get('quoted_status') is not None,
+                record.get('in_reply_to_status_id') is not None,
+                
+                # Location
+                location,
+                record.get('geo', {}).get('coordinates', ''),
+                
+                # Media and entities
+                media_count > 0,
+                media_count,
+                len(entities.get('hashtags') or ()),
+                len(entities.get('user_mentions') or ()),
+                len(entities.get('urls') or ()),
+                
+                # Language
+                record.get('lang', ''),
+                
+                # Source
+                record.get('source', ''),
+            )
+            
+            rows.append(row)
+            
+        except Exception as e:
+            print(f"⚠️ Error processing record: {e}")
+            continue
+    
+    return rows
 
 class XDataProcessor:
     def __init__(self, json_file_path):
@@ -23,18 +196,33 @@ class XDataProcessor:
         self.json_file_path = json_file_path
         self.raw_data = None
         self.processed_df = None
-        self.finance_bill_hashtags = [
+        
+        # Finance Bill rows and their summary aggregates, shared by the
+        # analyses until the data is re-processed
+        self._finance_df = None
+        self._finance_aggregates = None
+        
+        # Lower-cased to match the lower-cased text the hashtags are taken from
+        self.finance_bill_hashtags = frozenset(hashtag.lower() for hashtag in [
             '#rejectfinancebill2024', '#rutomustgo', '#occupyparliament', 
             '#genzkenya', '#kenyaprotests', '#genzrevolution', '#totalshutdown',
             '#kenyangenz', '#financebill2024', '#youth4change', '#rutoamustgo',
             '#parliamentoccupied', '#kenyageneration', '#kenyanprotest', '#genzparliament'
-        ]
+        ])
         
     def load_data(self):
         """Load X/Twitter JSON data"""
         try:
-            with open(self.json_file_path, 'r', encoding='utf-8') as f:
-                self.raw_data = json.load(f)
+            # One tweet per line: stream it, parsing a line at a time
+            if self._is_jsonl():
+                self.raw_data = self._iter_jsonl()
+                print("✅ Streaming X/Twitter records (JSON Lines)")
+                return True
+            
+            # Parse straight from bytes; orjson skips the text decode and builds
+            # the record dicts faster than the stdlib parser
+            with open(self.json_file_path, 'rb') as f:
+                self.raw_data = _loads(f.read())
             
             # Handle different JSON structures
             if isinstance(self.raw_data, dict):
@@ -55,166 +243,117 @@ class XDataProcessor:
             print(f"❌ Error loading data: {e}")
             return False
     
-    def process_data(self):
-        """Process raw X/Twitter data into structured DataFrame"""
+    def _is_jsonl(self):
+        """Whether the file is JSON Lines rather than one JSON document"""
+        if self.json_file_path.lower().endswith(('.jsonl', '.ndjson')):
+            return True
+        
+        # Otherwise: the first line is a whole JSON object and more lines follow
+        with open(self.json_file_path, 'rb') as f:
+            first_line = f.readline()
+            if not first_line.lstrip().startswith(b'{'):
+                return False
+            try:
+                _loads(first_line)
+            except ValueError:
+                return False
+            return any(line.strip() for line in f)
+    
+    def _iter_jsonl(self):
+        """Yield tweet records one line at a time, skipping blank lines"""
+        with open(self.json_file_path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
+    
+    def process_data(self, batch_size=50_000, workers=None):
+        """
+        Process raw X/Twitter data into structured DataFrame
+        
+        Args:
+            batch_size (int): Records turned into rows per batch
+            workers (int): Worker processes for the batches (default: one per CPU; 1, or a single batch, runs inline)
+        """
         if not self.raw_data:
             print("❌ No data loaded. Run load_data() first.")
             return None
             
-        processed_records = []
+        # One tuple per tweet in _PROCESSED_COLUMNS order, built a batch at a
+        # time and in worker processes when more than one CPU is available
+        rows = []
+        records = iter(self.raw_data)
+        batches = iter(lambda: list(islice(records, batch_size)), [])
+        workers = workers or os.cpu_count() or 1
+        
+        # A single batch (the usual scrape) is not worth starting worker
+        # processes for, so peek at the first two
+        head = list(islice(batches, 2))
+        batches = chain(head, batches)
+        if workers == 1 or len(head) < 2:
+            for batch in batches:
+                rows += _process_batch(batch)
+        else:
+            # Only a couple of batches per worker are in flight, so a streamed
+            # file is still never fully held in memory
+            pending = deque()
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                while True:
+                    while len(pending) < 2 * workers and (batch := next(batches, None)):
+                        pending.append(executor.submit(_process_batch, batch))
+                    if not pending:
+                        break
+                    rows += pending.popleft().result()
+        
+        # Raw records are not needed once processed (and a stream is spent)
+        self.raw_data = None
         
-        for record in self.raw_data:
-            try:
-                # Handle different tweet structures
-                processed_record = {
-                    # Tweet metadata
-                    'tweet_id': record.get('id', record.get('id_str', '')),
-                    'tweet_url': f"https://twitter.com/i/web/status/{record.get('id', record.get('id_str', ''))}",
-                    'text': record.get('text', record.get('full_text', '')),
-                    
-                    # Author info - handle nested user object
-                    'author_username': self._get_user_field(record, 'screen_name'),
-                    'author_display_name': self._get_user_field(record, 'name'),
-                    'author_followers': self._get_user_field(record, 'followers_count'),
-                    'author_verified': self._get_user_field(record, 'verified'),
-                    'author_id': self._get_user_field(record, 'id_str'),
-                    
-                    # Engagement metrics
-                    'likes': record.get('favorite_count', record.get('favourites_count', 0)),
-                    'retweets': record.get('retweet_count', 0),
-                    'replies': record.get('reply_count', 0),
-                    'quotes': record.get('quote_count', 0),
-                    
-                    # Timing
-                    'created_at': record.get('created_at', ''),
-                    'created_timestamp': self._parse_twitter_date(record.get('created_at', '')),
-                    
-                    # Tweet type
-                    'is_retweet': record.get('retweeted_status') is not None,
-                    'is_quote': record.get('quoted_status') is not None,
-                    'is_reply': record.get('in_reply_to_status_id') is not None,
-                    
-                    # Location
-                    'location': self._get_user_field(record, 'location'),
-                    'geo_coordinates': record.get('geo', {}).get('coordinates', ''),
-                    
-                    # Media and entities
-                    'has_media': self._has_media(record),
-                    'media_count': self._count_media(record),
-                    'hashtag_count': self._count_hashtags(record),
-                    'mention_count': self._count_mentions(record),
-                    'url_count': self._count_urls(record),
-                    
-                    # Language
-                    'language': record.get('lang', ''),
-                    
-                    # Source
-                    'source': record.get('source', ''),
-                }
-                
-                processed_records.append(processed_record)
-                
-            except Exception as e:
-                print(f"⚠️ Error processing record: {e}")
-                continue
+        self.processed_df = pd.DataFrame(rows, columns=_PROCESSED_COLUMNS)
+        self._finance_df = None
+        self._finance_aggregates = None
+        
+        # Parse timestamps in one vectorized pass, normalized to UTC; anything
+        # not in Twitter's format is retried as ISO 8601
+        created_at = self.processed_df['created_at']
+        timestamps = pd.to_datetime(created_at, format=_TWITTER_DATE_FORMAT, utc=True, errors='coerce')
+        iso = timestamps.isna() & created_at.ne('')
+        if iso.any():
+            timestamps[iso] = pd.to_datetime(created_at[iso].astype(str), format='ISO8601', utc=True, errors='coerce')
+        self.processed_df.insert(self.processed_df.columns.get_loc('created_at') + 1, 'created_timestamp', timestamps)
+        
+        # Categorical codes cut memory and make the author group-bys hash ints
+        for column in _CATEGORY_COLUMNS:
+            self.processed_df[column] = self.processed_df[column].astype('category')
+        
+        # Half-width counts; a column keeps int64 if any value would overflow
+        # (or stays float if the scrape had nulls)
+        for column in _COUNT_COLUMNS:
+            values = self.processed_df[column]
+            if values.dtype.kind == 'i' and values.abs().max() <= _INT32_MAX:
+                self.processed_df[column] = values.astype('int32')
         
-        self.processed_df = pd.DataFrame(processed_records)
         print(f"✅ Processed {len(self.processed_df)} records")
         return self.processed_df
     
-    def _get_user_field(self, record, field):
-        """Extract user field from various possible locations"""
-        # Direct user object
-        if 'user' in record and isinstance(record['user'], dict):
-            return record['user'].get(field, '')
-        
-        # Direct field (some APIs flatten user data)
-        if field in record:
-            return record[field]
-        
-        # Author object
-        if 'author' in record and isinstance(record['author'], dict):
-            return record['author'].get(field, '')
-        
-        return ''
-    
-    def _parse_twitter_date(self, date_str):
-        """Parse Twitter date format to datetime"""
-        if not date_str:
-            return None
-        try:
-            # Twitter format: "Wed Oct 05 20:30:00 +0000 2022"
-            return datetime.strptime(date_str, "%a %b %d %H:%M:%S %z %Y")
-        except:
-            try:
-                # ISO format
-                return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            except:
-                return None
-    
-    def _has_media(self, record):
-        """Check if tweet has media"""
-        entities = record.get('entities', {})
-        extended_entities = record.get('extended_entities', {})
-        
-        media = entities.get('media', []) + extended_entities.get('media', [])
-        return len(media) > 0
-    
-    def _count_media(self, record):
-        """Count media items in tweet"""
-        entities = record.get('entities', {})
-        extended_entities = record.get('extended_entities', {})
-        
-        media = entities.get('media', []) + extended_entities.get('media', [])
-        return len(media)
-    
-    def _count_hashtags(self, record):
-        """Count hashtags in tweet"""
-        entities = record.get('entities', {})
-        hashtags = entities.get('hashtags', [])
-        return len(hashtags)
-    
-    def _count_mentions(self, record):
-        """Count mentions in tweet"""
-        entities = record.get('entities', {})
-        mentions = entities.get('user_mentions', [])
-        return len(mentions)
-    
-    def _count_urls(self, record):
-        """Count URLs in tweet"""
-        entities = record.get('entities', {})
-        urls = entities.get('urls', [])
-        return len(urls)
-    
     def extract_hashtags(self):
         """Extract hashtags from tweet text"""
         if self.processed_df is None:
             print("❌ No processed data. Run process_data() first.")
             return None
             
-        def get_hashtags(text):
-            if pd.isna(text):
-                return []
-            hashtags = re.findall(r'#\w+', str(text).lower())
-            return hashtags
+        text_lower = self.processed_df['text'].fillna('').astype(str).str.lower()
+        self.processed_df['hashtags'] = text_lower.str.findall(_HASHTAG_RE)
         
-        self.processed_df['hashtags'] = self.processed_df['text'].apply(get_hashtags)
-        
-        # Filter for Finance Bill related content
-        def has_finance_bill_hashtag(hashtag_list):
-            return any(hashtag in self.finance_bill_hashtags for hashtag in hashtag_list)
-        
-        self.processed_df['finance_bill_related'] = self.processed_df['hashtags'].apply(has_finance_bill_hashtag)
-        
-        # Also check text content for keywords
-        finance_keywords = ['finance bill', 'ruto must go', 'occupy parliament', 'gen z', 'kenya protest']
-        def has_finance_keywords(text):
-            if pd.isna(text):
-                return False
-            text_lower = str(text).lower()
-            return any(keyword in text_lower for keyword in finance_keywords)
+        # Filter for Finance Bill related content: flatten the hashtag lists,
+        # test each tag against the set, and fold back to one flag per tweet
+        self.processed_df['finance_bill_related'] = (
+            self.processed_df['hashtags'].explode().isin(self.finance_bill_hashtags).groupby(level=0).any()
+        )
         
-        self.processed_df['finance_bill_keywords'] = self.processed_df['text'].apply(has_finance_keywords)
+        # Also check text content for keywords, as one alternation over the
+        # lowered text; rows a hashtag already flagged are not scanned
+        need_scan = ~self.processed_df['finance_bill_related']
+        self.processed_df['finance_bill_keywords'] = False
+        self.processed_df.loc[need_scan, 'finance_bill_keywords'] = text_lower[need_scan].str.contains(_FINANCE_KEYWORD_RE)
         
         # Combine hashtag and keyword filters
         self.processed_df['finance_bill_content'] = (
@@ -222,69 +361,56 @@ class XDataProcessor:
             self.processed_df['finance_bill_keywords']
         )
         
-        finance_bill_df = self.processed_df[self.processed_df['finance_bill_content'] == True]
+        self._finance_df = None
+        self._finance_aggregates = None
+        finance_bill_df = self._get_finance_df()
         print(f"✅ Found {len(finance_bill_df)} Finance Bill related tweets")
         
         return finance_bill_df
     
+    def _get_finance_df(self):
+        """Finance Bill rows of processed_df, filtered once and reused"""
+        if self._finance_df is None:
+            self._finance_df = self.processed_df[self.processed_df['finance_bill_content']].copy()
+        return self._finance_df
+    
     def analyze_hashtags(self):
         """Analyze hashtag patterns and frequency"""
         if self.processed_df is None:
             return None
             
-        # Get all hashtags
-        all_hashtags = []
-        for hashtag_list in self.processed_df['hashtags']:
-            all_hashtags.extend(hashtag_list)
-        
-        # Count frequencies
-        hashtag_counts = Counter(all_hashtags)
+        # Count frequencies over the flattened hashtag column
+        hashtag_counts = self.processed_df['hashtags'].explode().dropna().value_counts()
         
         # Focus on Finance Bill hashtags
-        finance_bill_counts = {hashtag: count for hashtag, count in hashtag_counts.items() 
-                              if hashtag in self.finance_bill_hashtags}
+        finance_bill_counts = hashtag_counts[hashtag_counts.index.isin(self.finance_bill_hashtags)]
         
         print("📊 Finance Bill Hashtag Analysis:")
-        for hashtag, count in sorted(finance_bill_counts.items(), key=lambda x: x[1], reverse=True):
+        for hashtag, count in finance_bill_counts.items():
             print(f"   {hashtag}: {count} tweets")
         
-        return hashtag_counts, finance_bill_counts
+        return hashtag_counts.to_dict(), finance_bill_counts.to_dict()
     
     def get_top_influencers(self, n=50):
         """Get top influencers by engagement metrics"""
         if self.processed_df is None:
             return None
             
-        # Filter for Finance Bill content
-        finance_df = self.processed_df[self.processed_df['finance_bill_content'] == True]
-        
-        # Group by author and calculate metrics
-        influencer_stats = finance_df.groupby('author_username').agg({
-            'likes': 'sum',
-            'retweets': 'sum', 
-            'replies': 'sum',
-            'quotes': 'sum',
-            'tweet_id': 'count',
-            'author_followers': 'first',
-            'author_display_name': 'first',
-            'author_verified': 'first'
-        }).rename(columns={'tweet_id': 'tweet_count'})
-        
-        # Calculate engagement metrics
-        influencer_stats['total_engagement'] = (
-            influencer_stats['likes'] + 
-            influencer_stats['retweets'] + 
-            influencer_stats['replies'] + 
-            influencer_stats['quotes']
-        )
-        
-        influencer_stats['avg_engagement_per_tweet'] = (
-            influencer_stats['total_engagement'] / influencer_stats['tweet_count']
+        finance_df = self._get_finance_df()
+        top_influencers = self._get_finance_aggregates()['influencers'].head(n).to_pandas().set_index('author_username')
+        
+        # Author fields are mixed-type object columns ('' when a scrape has no
+        # user info) that Polars cannot hold, so each top author's first
+        # non-null value is looked up here by username
+        authors = finance_df[finance_df['author_username'].isin(top_influencers.index)]
+        attributes = authors.groupby('author_username', observed=True)[list(_AUTHOR_ATTRIBUTES)].first()
+        for column in _AUTHOR_ATTRIBUTES:
+            top_influencers[column] = attributes[column].reindex(top_influencers.index)
+        
+        top_influencers['avg_engagement_per_tweet'] = (
+            top_influencers['total_engagement'] / top_influencers['tweet_count']
         )
         
-        # Sort by total engagement
-        top_influencers = influencer_stats.sort_values('total_engagement', ascending=False).head(n)
-        
         print(f"🎯 Top {n} Finance Bill X/Twitter Influencers:")
         for i, (username, stats) in enumerate(top_influencers.iterrows(), 1):
             verified_mark = "✅" if stats['author_verified'] else ""
@@ -294,30 +420,120 @@ class XDataProcessor:
         
         return top_influencers
     
+    def _get_finance_aggregates(self):
+        """
+        Summary aggregates of the Finance Bill rows as small Polars DataFrames:
+        the influencer ranking, engagement totals and tweet types, the top
+        languages and daily/hourly activity, all collected together once
+        """
+        if self._finance_aggregates is not None:
+            return self._finance_aggregates
+        
+        finance_df = self._get_finance_df()
+        finance = pl.from_pandas(pd.DataFrame({
+            'author_username': finance_df['author_username'],
+            'likes': finance_df['likes'],
+            'retweets': finance_df['retweets'],
+            'replies': finance_df['replies'],
+            'quotes': finance_df['quotes'],
+            'is_retweet': finance_df['is_retweet'],
+            'is_reply': finance_df['is_reply'],
+            'is_quote': finance_df['is_quote'],
+            'created_timestamp': finance_df['created_timestamp'],
+            'language': finance_df['language'],
+            'has_tweet_id': finance_df['tweet_id'].notna(),
+        })).with_columns(pl.col(pl.Int32).cast(pl.Int64)).lazy()  # int32 counts sum in int64
+        
+        plans = {
+            'influencers': self._influencer_plan(finance),
+            'totals': self._totals_plan(finance),
+            'languages': self._language_plan(finance),
+            'daily': self._activity_plan(finance, pl.col('created_timestamp').dt.truncate('1d').alias('date')),
+            'hourly': self._activity_plan(finance, pl.col('created_timestamp').dt.hour().cast(pl.Int8).alias('hour')),
+        }
+        
+        # One collect runs the plans together over the shared frame
+        self._finance_aggregates = dict(zip(plans, pl.collect_all(list(plans.values()))))
+        return self._finance_aggregates
+    
+    @staticmethod
+    def _influencer_plan(finance):
+        """Engagement and tweet counts per author, highest total engagement first"""
+        return (
+            finance
+            .filter(pl.col('author_username').is_not_null())
+            .group_by('author_username')
+            .agg(
+                pl.col('likes', 'retweets', 'replies', 'quotes').sum(),
+                pl.col('has_tweet_id').sum().cast(pl.Int64).alias('tweet_count'),
+            )
+            .with_columns(total_engagement=pl.col('likes') + pl.col('retweets') + pl.col('replies') + pl.col('quotes'))
+            .sort(['total_engagement', 'author_username'], descending=[True, False])
+        )
+    
+    @staticmethod
+    def _totals_plan(finance):
+        """Engagement totals, means and maxima, and the tweet type counts"""
+        counts = pl.col('likes', 'retweets', 'replies', 'quotes')
+        is_retweet, is_reply, is_quote = pl.col('is_retweet'), pl.col('is_reply'), pl.col('is_quote')
+        # Tweet types overlap, so each is counted on its own flags
+        return finance.select(
+            counts.sum().name.suffix('_total'),
+            counts.mean().name.suffix('_mean'),
+            counts.max().name.suffix('_max'),
+            original=(~is_retweet & ~is_reply).sum(),
+            retweet=is_retweet.sum(),
+            reply=is_reply.sum(),
+            quote=is_quote.sum(),
+        )
+    
+    @staticmethod
+    def _language_plan(finance):
+        """The five most used languages"""
+        # Ties keep the category (alphabetical) order value_counts gave
+        return (
+            finance.filter(pl.col('language').is_not_null())
+            .group_by('language').agg(pl.len().cast(pl.Int64).alias('tweets'))
+            .sort(['tweets', 'language'], descending=[True, False])
+            .head(5)
+        )
+    
+    @staticmethod
+    def _activity_plan(finance, key):
+        """Tweets per time bucket (a day or an hour of the creation time)"""
+        return (
+            finance.filter(pl.col('created_timestamp').is_not_null())
+            .group_by(key).agg(pl.len().cast(pl.Int64).alias('tweets'))
+            .sort(key.meta.output_name())
+        )
+    
     def timeline_analysis(self):
         """Analyze posting timeline and activity patterns"""
         if self.processed_df is None:
             return None
             
-        # Convert timestamps
-        self.processed_df['created_date'] = pd.to_datetime(self.processed_df['created_timestamp'])
-        
         # Filter for Finance Bill content
-        finance_df = self.processed_df[self.processed_df['finance_bill_content'] == True]
+        finance_df = self._get_finance_df()
         
         if len(finance_df) == 0:
             print("❌ No Finance Bill content found for timeline analysis")
             return None
         
+        aggregates = self._get_finance_aggregates()
+        
         # Daily activity
-        daily_activity = finance_df.groupby(finance_df['created_date'].dt.date).size()
+        daily = aggregates['daily']
+        daily_activity = pd.Series(daily['tweets'].to_numpy(),
+                                   index=pd.DatetimeIndex(daily['date'].to_pandas(), name='created_timestamp'))
         
         # Hourly activity
-        hourly_activity = finance_df.groupby(finance_df['created_date'].dt.hour).size()
+        hourly = aggregates['hourly']
+        hourly_activity = pd.Series(hourly['tweets'].to_numpy(),
+                                    index=pd.Index(hourly['hour'].to_numpy(), name='created_timestamp'))
         
         print("📅 Timeline Analysis:")
-        print(f"   Date range: {daily_activity.index.min()} to {daily_activity.index.max()}")
-        print(f"   Peak day: {daily_activity.idxmax()} ({daily_activity.max()} tweets)")
+        print(f"   Date range: {daily_activity.index.min():%Y-%m-%d} to {daily_activity.index.max():%Y-%m-%d}")
+        print(f"   Peak day: {daily_activity.idxmax():%Y-%m-%d} ({daily_activity.max()} tweets)")
         print(f"   Total days active: {len(daily_activity)}")
         print(f"   Peak hour: {hourly_activity.idxmax()}:00 ({hourly_activity.max()} tweets)")
         
@@ -328,19 +544,25 @@ class XDataProcessor:
         if self.processed_df is None:
             return None
             
-        finance_df = self.processed_df[self.processed_df['finance_bill_content'] == True]
+        finance_df = self._get_finance_df()
+        
+        if len(finance_df) == 0:
+            print("❌ No Finance Bill content found for engagement analysis")
+            return None
+        
+        totals = self._get_finance_aggregates()['totals'].row(0, named=True)
         
         print("📊 Engagement Analysis:")
-        print(f"   Most liked tweet: {finance_df['likes'].max():,} likes")
-        print(f"   Most retweeted: {finance_df['retweets'].max():,} retweets")
-        print(f"   Most replied to: {finance_df['replies'].max():,} replies")
+        print(f"   Most liked tweet: {totals['likes_max']:,} likes")
+        print(f"   Most retweeted: {totals['retweets_max']:,} retweets")
+        print(f"   Most replied to: {totals['replies_max']:,} replies")
         
         # Tweet types analysis
         tweet_types = {
-            'Original tweets': len(finance_df[~finance_df['is_retweet'] & ~finance_df['is_reply']]),
-            'Retweets': len(finance_df[finance_df['is_retweet']]),
-            'Replies': len(finance_df[finance_df['is_reply']]),
-            'Quotes': len(finance_df[finance_df['is_quote']])
+            'Original tweets': totals['original'],
+            'Retweets': totals['retweet'],
+            'Replies': totals['reply'],
+            'Quotes': totals['quote']
         }
         
         print("\n📊 Tweet Types:")
@@ -360,28 +582,29 @@ class XDataProcessor:
         print("="*60)
         
         # Basic stats
+        finance_df = self._get_finance_df()
         total_tweets = len(self.processed_df)
-        finance_tweets = len(self.processed_df[self.processed_df['finance_bill_content'] == True])
+        finance_tweets = len(finance_df)
         
         print(f"📊 Dataset Overview:")
         print(f"   Total tweets: {total_tweets:,}")
         print(f"   Finance Bill related: {finance_tweets:,} ({finance_tweets/total_tweets*100:.1f}%)")
         
         # Engagement stats
-        finance_df = self.processed_df[self.processed_df['finance_bill_content'] == True]
         if len(finance_df) > 0:
+            aggregates = self._get_finance_aggregates()
+            totals = aggregates['totals'].row(0, named=True)
             print(f"\n🎯 Finance Bill Content Engagement:")
-            print(f"   Total likes: {finance_df['likes'].sum():,}")
-            print(f"   Total retweets: {finance_df['retweets'].sum():,}")
-            print(f"   Total replies: {finance_df['replies'].sum():,}")
-            print(f"   Total quotes: {finance_df['quotes'].sum():,}")
-            print(f"   Average likes per tweet: {finance_df['likes'].mean():.1f}")
-            print(f"   Average retweets per tweet: {finance_df['retweets'].mean():.1f}")
+            print(f"   Total likes: {totals['likes_total']:,}")
+            print(f"   Total retweets: {totals['retweets_total']:,}")
+            print(f"   Total replies: {totals['replies_total']:,}")
+            print(f"   Total quotes: {totals['quotes_total']:,}")
+            print(f"   Average likes per tweet: {totals['likes_mean']:.1f}")
+            print(f"   Average retweets per tweet: {totals['retweets_mean']:.1f}")
             
             # Language analysis
-            lang_counts = finance_df['language'].value_counts().head(5)
             print(f"\n🌍 Top Languages:")
-            for lang, count in lang_counts.items():
+            for lang, count in aggregates['languages'].iter_rows():
                 print(f"   {lang}: {count} tweets ({count/len(finance_df)*100:.1f}%)")
         
         # Top hashtags
@@ -440,16 +663,16 @@ if __name__ == "__main__":
             summary = processor.create_summary_report()
             
             # Save processed data
-            processor.processed_df.to_csv("data/processed_data/x_processed.csv", index=False)
-            finance_df.to_csv("data/processed_data/x_finance_bill.csv", index=False)
+            _to_parquet(processor.processed_df, "data/processed_data/x_processed.parquet")
+            _to_parquet(finance_df, "data/processed_data/x_finance_bill.parquet")
             
             # Export influencer list
             processor.export_influencer_list()
             
             print("\n✅ Processing complete! Files saved to data/processed_data/")
             print("📁 Files created:")
-            print("   - x_processed.csv (all processed tweets)")
-            print("   - x_finance_bill.csv (Finance Bill related tweets)")
+            print("   - x_processed.parquet (all processed tweets)")
+            print("   - x_finance_bill.parquet (Finance Bill related tweets)")
             print("   - finance_bill_influencers.csv (Top influencers)")
         else:
             print("❌ Failed to process data.")
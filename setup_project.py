@@ -238,7 +238,7 @@ def create_requirements_txt():
     """Create requirements.txt for Python dependencies"""
     
     requirements = """# Core Data Science
-pandas>=1.3.0
+pandas>=2.0.0
 numpy>=1.21.0
 scikit-learn>=1.0.0
 matplotlib>=3.4.0
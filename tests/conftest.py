@@ -0,0 +1,17 @@
+"""
+Shared fixtures for the analytics script tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# The processors are standalone scripts, imported straight from their folder
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'analytics' / 'scripts'))
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_dir(tmp_path, monkeypatch):
+    """Run each test from a scratch directory (the processors create data/ folders)"""
+    monkeypatch.chdir(tmp_path)
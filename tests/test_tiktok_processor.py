@@ -0,0 +1,122 @@
+"""
+Regression tests for tiktok_processor: the batched json_normalize flatten
+must produce the rows the original per-record loop did
+"""
+
+import copy
+
+import pandas as pd
+
+from tiktok_processor import TikTokDataProcessor
+
+RECORDS = [
+    # Full Apify record
+    {'id': '7384000000000000001', 'url': 'https://www.tiktok.com/@amani/video/1',
+     'desc': 'Reject #RejectFinanceBill2024', 'text': 'Reject #RejectFinanceBill2024 #GenZKenya',
+     'author': {'uniqueId': 'amani', 'nickname': 'Amani', 'followerCount': 12000, 'verified': True},
+     'stats': {'diggCount': 500, 'commentCount': 40, 'shareCount': 12, 'playCount': 9000},
+     'createTime': 1719316800, 'createTimeISO': '2024-06-25T12:00:00.000Z',
+     'music': {'title': 'original sound', 'authorName': 'amani'},
+     'video': {'duration': 15, 'width': 576, 'height': 1024}},
+    # Description only, partial author and stats
+    {'id': '7384000000000000002', 'desc': 'only a description #OccupyParliament',
+     'author': {'uniqueId': 'wanjiru'}, 'stats': {'diggCount': 3}, 'createTime': 1719403200},
+    # No author, stats or createTime
+    {'id': '7384000000000000003', 'text': 'no author or stats'},
+]
+
+# What the per-record loop produced for RECORDS
+EXPECTED = {
+    'video_id': ['7384000000000000001', '7384000000000000002', '7384000000000000003'],
+    'video_url': ['https://www.tiktok.com/@amani/video/1', '', ''],
+    'description': ['Reject #RejectFinanceBill2024', 'only a description #OccupyParliament', ''],
+    'text': ['Reject #RejectFinanceBill2024 #GenZKenya', 'only a description #OccupyParliament',
+             'no author or stats'],
+    'author_username': ['amani', 'wanjiru', ''],
+    'author_display_name': ['Amani', '', ''],
+    'author_followers': [12000, 0, 0],
+    'author_verified': [True, False, False],
+    'likes': [500, 3, 0],
+    'comments': [40, 0, 0],
+    'shares': [12, 0, 0],
+    'views': [9000, 0, 0],
+    'created_at': [1719316800, 1719403200, pd.NA],
+    'created_timestamp': ['2024-06-25T12:00:00.000Z', '', ''],
+    'music_title': ['original sound', '', ''],
+    'music_author': ['amani', '', ''],
+    'duration': [15, 0, 0],
+    'video_width': [576, 0, 0],
+    'video_height': [1024, 0, 0],
+}
+
+
+def process(records, **kwargs):
+    processor = TikTokDataProcessor('unused.json')
+    processor.raw_data = iter(copy.deepcopy(records))
+    assert processor.process_data(**kwargs) is not None
+    return processor
+
+
+def test_batch_matches_per_record_rows():
+    df = process(RECORDS).processed_df
+
+    assert list(df.columns) == list(EXPECTED)
+    for column, expected in EXPECTED.items():
+        assert df[column].tolist() == expected, column
+
+
+def test_output_round_trips_through_parquet(tmp_path):
+    processor = process(RECORDS)
+    finance_df = processor.extract_hashtags()
+    df = processor.processed_df
+
+    # The same writes the script's __main__ makes
+    assert df['created_at'].dtype == 'Int64'
+    df.to_parquet(tmp_path / 'tiktok_processed.parquet', index=False, compression='zstd')
+    finance_df.to_parquet(tmp_path / 'tiktok_finance_bill.parquet', index=False, compression='zstd')
+
+    round_trip = pd.read_parquet(tmp_path / 'tiktok_processed.parquet')
+    assert round_trip['created_at'].tolist() == EXPECTED['created_at']
+    assert round_trip['video_id'].tolist() == EXPECTED['video_id']
+    assert len(pd.read_parquet(tmp_path / 'tiktok_finance_bill.parquet')) == len(finance_df)
+
+
+def test_batch_size_does_not_change_rows():
+    df = process(RECORDS, batch_size=1).processed_df
+
+    for column, expected in EXPECTED.items():
+        assert df[column].tolist() == expected, column
+
+
+def test_unparseable_counts_are_zero():
+    records = [{'id': '1', 'desc': 'a', 'stats': {'diggCount': '1.2K', 'playCount': '900'}}]
+    df = process(records).processed_df
+
+    assert df['likes'].tolist() == [0]
+    assert df['views'].tolist() == [900]
+    assert df['likes'].dtype == 'int64'
+
+
+def test_records_that_are_not_objects_are_skipped(capsys):
+    df = process(RECORDS[:1] + ['not a record', None] + RECORDS[1:]).processed_df
+
+    assert df['video_id'].tolist() == EXPECTED['video_id']
+    assert 'Skipped 2 records' in capsys.readouterr().out
+
+
+def test_finance_bill_filter_matches_whole_hashtags():
+    records = [
+        {'id': '1', 'desc': 'Reject #RejectFinanceBill2024'},
+        {'id': '2', 'desc': '#RutoMustGoo is a longer tag'},
+        {'id': '3', 'desc': '#rutomustgo, now'},
+        {'id': '4', 'desc': 'finance bill without a tag'},
+        {'id': '5', 'desc': '#GenZKenya#OccupyParliament'},
+    ]
+    processor = process(records)
+    finance_df = processor.extract_hashtags()
+    df = processor.processed_df
+
+    assert df['hashtags'].tolist() == [['#rejectfinancebill2024'], ['#rutomustgoo'], ['#rutomustgo'], [],
+                                       ['#genzkenya', '#occupyparliament']]
+    assert df['finance_bill_related'].tolist() == [True, False, True, False, True]
+    assert finance_df['video_id'].tolist() == ['1', '3', '5']
@@ -0,0 +1,163 @@
+"""
+Regression tests for x_data_processor: the batched json_normalize flatten
+must produce the rows the original per-record loop did
+"""
+
+import copy
+import datetime
+
+import pandas as pd
+import pytest
+
+import x_data_processor
+from x_data_processor import XDataProcessor
+
+RECORDS = [
+    # Classic v1.1 tweet with a nested user object and entities
+    {'id': 1800000000000000001, 'text': 'Reject it #RejectFinanceBill2024 @KenyaGov https://t.co/x',
+     'user': {'screen_name': 'amani', 'name': 'Amani', 'followers_count': 900, 'friends_count': 12,
+              'verified': True, 'id_str': '42', 'created_at': 'Mon Jan 01 00:00:00 +0000 2018',
+              'location': 'Nairobi'},
+     'favorite_count': 4000, 'retweet_count': 300, 'reply_count': 76, 'quote_count': 5,
+     'created_at': 'Tue Jun 25 14:30:00 +0000 2024', 'lang': 'en', 'source': 'web',
+     'entities': {'hashtags': [{'text': 'RejectFinanceBill2024'}], 'user_mentions': [{'screen_name': 'KenyaGov'}],
+                  'urls': [{'expanded_url': 'https://example.com/a'}, {'url': 'https://t.co/y'}],
+                  'media': [{'type': 'photo'}]},
+     'extended_entities': {'media': [{'type': 'video'}]}},
+    # Flattened scraper output with an 'author' object and full_text
+    {'id_str': '1800000000000000002', 'full_text': 'Finance bill protests in town #GenZKenya',
+     'author': {'username': 'wanjiru', 'display_name': 'Wanjiru', 'followers': 0, 'following': 3, 'id': 7},
+     'likes': 10, 'retweets': 2, 'replies': 1, 'created_at': '2024-06-20T08:15:00.000Z',
+     'retweeted_status': {'id': 1}, 'lang': 'sw'},
+    # User fields at the root and no text at all: skipped
+    {'id': 1800000000000000003, 'screen_name': 'ghost', 'followers_count': 5},
+    # Reply with content text and no engagement counts
+    {'id': 1800000000000000004, 'content': 'Total shutdown tomorrow', 'in_reply_to_status_id': 9,
+     'user': {'screen_name': 'otieno', 'followers_count': 50}, 'created_at': 'Wed Jun 26 23:59:59 +0000 2024'},
+    # Quote tweet with no id and nothing Finance Bill related
+    {'text': 'Nice weather today #sunny', 'is_quote_status': True,
+     'user': {'screen_name': 'amani', 'followers_count': 901}, 'favorite_count': 1},
+]
+
+# What the per-record loop produced for RECORDS (ids and timestamps below)
+EXPECTED = {
+    'tweet_url': ['https://twitter.com/i/web/status/1800000000000000001',
+                  'https://twitter.com/i/web/status/1800000000000000002',
+                  'https://twitter.com/i/web/status/1800000000000000004',
+                  'https://twitter.com/i/web/status/'],
+    'text': ['Reject it #RejectFinanceBill2024 @KenyaGov https://t.co/x',
+             'Finance bill protests in town #GenZKenya', 'Total shutdown tomorrow', 'Nice weather today #sunny'],
+    'author_username': ['amani', 'wanjiru', 'otieno', 'amani'],
+    'author_display_name': ['Amani', 'Wanjiru', '', ''],
+    'author_followers': [900, 0, 50, 901],
+    'author_following': [12, 3, 0, 0],
+    'author_verified': [True, False, False, False],
+    'author_created_at': ['Mon Jan 01 00:00:00 +0000 2018', '', '', ''],
+    'location': ['Nairobi', '', '', ''],
+    'likes': [4000, 10, 0, 1],
+    'retweets': [300, 2, 0, 0],
+    'replies': [76, 1, 0, 0],
+    'quotes': [5, 0, 0, 0],
+    'bookmarks': [0, 0, 0, 0],
+    'created_at': ['Tue Jun 25 14:30:00 +0000 2024', '2024-06-20T08:15:00.000Z', 'Wed Jun 26 23:59:59 +0000 2024', ''],
+    'created_date': ['2024-06-25', '2024-06-20', '2024-06-26', ''],
+    'created_time': ['14:30:00', '08:15:00', '23:59:59', ''],
+    'created_hour': [14, 8, 23, 0],
+    'created_day_of_week': ['Tuesday', 'Thursday', 'Wednesday', ''],
+    'is_retweet': [False, True, False, False],
+    'is_quote': [False, False, False, True],
+    'is_reply': [False, False, True, False],
+    'is_thread': [False, False, False, False],
+    'language': ['en', 'sw', '', ''],
+    'source': ['web', '', '', ''],
+    'possibly_sensitive': [False, False, False, False],
+    'mentions': [['@KenyaGov'], [], [], []],
+    'urls': [['https://example.com/a'], [], [], []],
+    'hashtag_count': [1, 1, 0, 1],
+    'mention_count': [1, 0, 0, 0],
+    'url_count': [1, 0, 0, 0],
+    'has_media': [True, False, False, False],
+    'media_count': [2, 0, 0, 0],
+    'media_types': [['photo', 'video'], [], [], []],
+    'total_engagement': [4376, 13, 0, 1],
+    'engagement_rate': [4376 / 900 * 100, 0.0, 0.0, 1 / 901 * 100],
+    'text_length': [57, 40, 23, 25],
+    'word_count': [5, 6, 3, 4],
+}
+
+
+def process(records, **kwargs):
+    processor = XDataProcessor('unused.json')
+    processor.raw_data = copy.deepcopy(records)
+    assert processor.process_data(**kwargs)
+    return processor
+
+
+def test_batch_matches_per_record_rows():
+    df = process(RECORDS, workers=1).processed_df
+
+    for column, expected in EXPECTED.items():
+        assert df[column].tolist() == expected, column
+
+    # Hashtags from entities and text, de-duplicated
+    assert df['hashtags'].tolist() == [['#rejectfinancebill2024'], ['#genzkenya'], [], ['#sunny']]
+
+
+def test_ids_are_strings_and_timestamps_utc():
+    df = process(RECORDS, workers=1).processed_df
+
+    assert df['tweet_id'].tolist() == ['1800000000000000001', '1800000000000000002',
+                                       '1800000000000000004', 'unknown_4']
+    assert df['author_id'].tolist() == ['42', '7', '', '']
+
+    utc = datetime.timezone.utc
+    assert df['created_timestamp'].tolist()[:3] == [
+        pd.Timestamp(2024, 6, 25, 14, 30, tzinfo=utc),
+        pd.Timestamp(2024, 6, 20, 8, 15, tzinfo=utc),
+        pd.Timestamp(2024, 6, 26, 23, 59, 59, tzinfo=utc),
+    ]
+    assert pd.isna(df['created_timestamp'].iloc[3])
+
+
+def test_engagement_rate_stays_float64():
+    df = process(RECORDS, workers=1).processed_df
+    assert df['engagement_rate'].dtype == 'float64'
+
+
+def test_batch_size_does_not_change_rows():
+    whole = process(RECORDS, workers=1).processed_df
+    batched = process(RECORDS, workers=1, batch_size=2).processed_df
+    pd.testing.assert_frame_equal(whole, batched, check_categorical=False)
+
+
+@pytest.mark.parametrize('bad_record', [
+    # v2-style hashtag entity
+    {'id': 99, 'text': 'v2 #tag', 'entities': {'hashtags': [{'tag': 'tag'}]}},
+    # Mention without a screen_name
+    {'id': 99, 'text': 'hi @someone', 'entities': {'user_mentions': [{'name': 'Someone'}]}},
+])
+def test_malformed_record_is_skipped(bad_record, capsys):
+    records = RECORDS[:2] + [bad_record] + RECORDS[2:]
+    df = process(records, workers=1).processed_df
+
+    assert df['text'].tolist() == EXPECTED['text']
+    assert 'Error processing record 2' in capsys.readouterr().out
+
+
+def test_single_batch_runs_inline(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError('a single batch should not start worker processes')
+    monkeypatch.setattr(x_data_processor, 'ProcessPoolExecutor', no_pool)
+
+    df = process(RECORDS, workers=4).processed_df
+    assert df['text'].tolist() == EXPECTED['text']
+
+
+def test_finance_bill_filter_matches_hashtags_and_keywords():
+    processor = process(RECORDS, workers=1)
+    assert processor.filter_finance_bill_content()
+
+    # Hashtag match, keyword + hashtag match, keyword-only match; not the weather
+    assert processor.finance_bill_df['tweet_id'].tolist() == [
+        '1800000000000000001', '1800000000000000002', '1800000000000000004'
+    ]
@@ -0,0 +1,136 @@
+"""
+Regression tests for x_processor: the positional row tuples must hold the
+values the original per-record dicts did
+"""
+
+import copy
+
+import pandas as pd
+
+import x_processor
+from x_processor import XDataProcessor
+
+RECORDS = [
+    # Classic v1.1 tweet with a nested user object, entities and geo
+    {'id': 1800000000000000001, 'text': 'Reject it #RejectFinanceBill2024 #GenZKenya',
+     'user': {'screen_name': 'amani', 'name': 'Amani', 'followers_count': 900, 'verified': True,
+              'id_str': '42', 'location': 'Nairobi'},
+     'favorite_count': 4000, 'retweet_count': 300, 'reply_count': 76, 'quote_count': 5,
+     'created_at': 'Tue Jun 25 14:30:00 +0000 2024', 'lang': 'en', 'source': 'web',
+     'entities': {'hashtags': [{'text': 'RejectFinanceBill2024'}, {'text': 'GenZKenya'}],
+                  'user_mentions': [{'screen_name': 'x'}], 'urls': [], 'media': [{'type': 'photo'}]},
+     'extended_entities': {'media': [{'type': 'photo'}, {'type': 'video'}]},
+     'geo': {'coordinates': [-1.28, 36.82]}},
+    # Flattened user fields at the root, every tweet type flag set
+    {'id_str': '1800000000000000002', 'full_text': 'no text key', 'screen_name': 'wanjiru',
+     'retweeted_status': {'id': 1}, 'quoted_status': {'id': 2}, 'in_reply_to_status_id': 5,
+     'favourites_count': 7},
+    # Explicit null id and an 'author' object
+    {'id': None, 'text': 'The finance bill must go',
+     'author': {'screen_name': 'otieno', 'name': 'Otieno', 'followers_count': 50}},
+    # No id at all
+    {'text': 'Nice weather #sunny', 'user': {'screen_name': 'amani', 'followers_count': 901}},
+]
+
+# What the per-record dicts held for RECORDS
+EXPECTED = {
+    'tweet_id': [1800000000000000001, '1800000000000000002', None, ''],
+    'tweet_url': ['https://twitter.com/i/web/status/1800000000000000001',
+                  'https://twitter.com/i/web/status/1800000000000000002',
+                  'https://twitter.com/i/web/status/None',
+                  'https://twitter.com/i/web/status/'],
+    'text': ['Reject it #RejectFinanceBill2024 #GenZKenya', 'no text key', 'The finance bill must go',
+             'Nice weather #sunny'],
+    'author_username': ['amani', 'wanjiru', 'otieno', 'amani'],
+    'author_display_name': ['Amani', '', 'Otieno', ''],
+    'author_followers': [900, '', 50, 901],
+    'author_verified': [True, '', '', ''],
+    'author_id': ['42', '1800000000000000002', '', ''],
+    'likes': [4000, 7, 0, 0],
+    'retweets': [300, 0, 0, 0],
+    'replies': [76, 0, 0, 0],
+    'quotes': [5, 0, 0, 0],
+    'created_at': ['Tue Jun 25 14:30:00 +0000 2024', '', '', ''],
+    'is_retweet': [False, True, False, False],
+    'is_quote': [False, True, False, False],
+    'is_reply': [False, True, False, False],
+    'location': ['Nairobi', '', '', ''],
+    'geo_coordinates': [[-1.28, 36.82], '', '', ''],
+    'has_media': [True, False, False, False],
+    'media_count': [3, 0, 0, 0],
+    'hashtag_count': [2, 0, 0, 0],
+    'mention_count': [1, 0, 0, 0],
+    'url_count': [0, 0, 0, 0],
+    'language': ['en', '', '', ''],
+    'source': ['web', '', '', ''],
+}
+
+
+def process(records, **kwargs):
+    processor = XDataProcessor('unused.json')
+    processor.raw_data = copy.deepcopy(records)
+    assert processor.process_data(**kwargs) is not None
+    return processor
+
+
+def test_rows_match_per_record_dicts():
+    df = process(RECORDS, workers=1).processed_df
+
+    for column, expected in EXPECTED.items():
+        assert df[column].tolist() == expected, column
+
+    assert df['created_timestamp'].iloc[0] == pd.Timestamp('2024-06-25 14:30:00', tz='UTC')
+    assert df['created_timestamp'].iloc[1:].isna().all()
+
+
+def test_tweet_url_keeps_every_digit_when_ids_are_missing():
+    # A missing id makes pandas infer tweet_id as float64
+    df = process([{'id': 1800000000000000001, 'text': 'a'}, {'id': None, 'text': 'b'}], workers=1).processed_df
+
+    assert df['tweet_url'].tolist() == ['https://twitter.com/i/web/status/1800000000000000001',
+                                        'https://twitter.com/i/web/status/None']
+
+
+def test_each_tweet_keeps_its_own_user_snapshot():
+    records = [{'id': i, 'text': 't', 'user': {'id_str': '42', 'screen_name': 'amani', 'followers_count': followers}}
+               for i, followers in enumerate([100, 150, 175])]
+    df = process(records, workers=1).processed_df
+
+    assert df['author_followers'].tolist() == [100, 150, 175]
+
+
+def test_batches_give_the_same_rows():
+    whole = process(RECORDS, workers=1).processed_df
+    batched = process(RECORDS, workers=1, batch_size=1).processed_df
+    pd.testing.assert_frame_equal(whole, batched)
+
+
+def test_single_batch_runs_inline(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError('a single batch should not start worker processes')
+    monkeypatch.setattr(x_processor, 'ProcessPoolExecutor', no_pool)
+
+    df = process(RECORDS, workers=4).processed_df
+    assert df['text'].tolist() == EXPECTED['text']
+
+
+def test_finance_bill_filter_combines_hashtags_and_keywords():
+    records = [
+        {'id': 1, 'text': 'Reject it #RejectFinanceBill2024'},
+        {'id': 2, 'text': 'The FINANCE BILL must go'},
+        {'id': 3, 'text': '#OccupyParliament because the finance bill is unfair'},
+        {'id': 4, 'text': '#RejectFinanceBill2024isnotatag and #sunny weather'},
+        {'id': 5, 'text': ''},
+    ]
+    processor = process(records, workers=1)
+    finance_df = processor.extract_hashtags()
+    df = processor.processed_df
+
+    assert df['hashtags'].tolist() == [['#rejectfinancebill2024'], [], ['#occupyparliament'],
+                                       ['#rejectfinancebill2024isnotatag', '#sunny'], []]
+    assert df['finance_bill_related'].tolist() == [True, False, True, False, False]
+    assert df['finance_bill_content'].tolist() == [True, True, True, False, False]
+    assert finance_df['tweet_id'].tolist() == [1, 2, 3]
+
+    # The keyword scan only runs where no hashtag matched
+    assert df['finance_bill_keywords'].tolist() == [False, True, False, False, False]